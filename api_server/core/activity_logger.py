@@ -33,7 +33,8 @@ class ActivityLogger:
             return user_ref
 
         try:
-            return User.objects(id=int(user_ref)).first()
+            # Logs only keep the reference and show the name
+            return User.objects(id=int(user_ref)).only('id', 'full_name').first()
         except Exception:
             return None
 
@@ -53,24 +54,66 @@ class ActivityLogger:
         """
         user_obj = ActivityLogger._resolve_user(user_id)
 
-        final_notes = notes
-        if quantity is not None:
-            if final_notes:
-                final_notes = f"Quantity: {quantity}. {final_notes}"
-            else:
-                final_notes = f"Quantity: {quantity}."
-
         log = ProductLog(
             product_id=product_id,
             user=user_obj,
             action_type=action_type,
             quantity=quantity,
-            notes=final_notes,
+            notes=ActivityLogger._quantity_notes(quantity, notes),
             log_time=datetime.now(timezone.utc)
         )
         log.save()
         return log
 
+    @staticmethod
+    def log_product_actions(entries):
+        """
+        Log several product actions with one insert.
+
+        Each entry is a dict with the keyword arguments of
+        log_product_action (product_id, user_id, action_type, quantity, notes).
+        IDs are reserved as one block and each distinct user is resolved once.
+        """
+        from utils.counters import get_next_sequence_block
+
+        entries = list(entries)
+        if not entries:
+            return []
+
+        users = {}
+        log_time = datetime.now(timezone.utc)
+        first_id = get_next_sequence_block(ProductLog.__name__.lower(), len(entries))
+
+        logs = []
+        for offset, entry in enumerate(entries):
+            user_ref = entry.get('user_id')
+            key = user_ref.id if isinstance(user_ref, User) else user_ref
+            if key not in users:
+                users[key] = ActivityLogger._resolve_user(user_ref)
+
+            quantity = entry.get('quantity')
+            logs.append(ProductLog(
+                id=first_id + offset,
+                product_id=entry['product_id'],
+                user=users[key],
+                action_type=entry['action_type'],
+                quantity=quantity,
+                notes=ActivityLogger._quantity_notes(quantity, entry.get('notes')),
+                log_time=log_time
+            ))
+
+        ProductLog.objects.insert(logs, load_bulk=False)
+        return logs
+
+    @staticmethod
+    def _quantity_notes(quantity, notes):
+        """Prefix notes with the logged quantity, when there is one."""
+        if quantity is None:
+            return notes
+        if notes:
+            return f"Quantity: {quantity}. {notes}"
+        return f"Quantity: {quantity}."
+
     # ---------------------------------------------------------
     # API-level logs
     # ---------------------------------------------------------
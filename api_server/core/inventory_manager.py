@@ -3,7 +3,7 @@
 from models.product import Product
 from models.stock_batch import StockBatch
 from datetime import date
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class InventoryError(Exception):
@@ -79,7 +79,8 @@ class InventoryManager:
         product_id: int,
         qty_needed: int,
         user_id: int = None,
-        reason: str = None
+        reason: str = None,
+        deductions: Optional[List[Dict[str, int]]] = None
     ) -> List[Dict[str, int]]:
         """
         Deduct stock from batches based on earliest expiration date first.
@@ -87,6 +88,9 @@ class InventoryManager:
 
         ✅ Returns a list of deductions:
             [{"batch_id": <int>, "quantity": <int>}, ...]
+
+        Pass `deductions` to have each batch appended as soon as it is saved;
+        if this raises part-way, the list still holds what was already taken.
         """
         product = Product.objects(id=product_id).first()
         if not product:
@@ -95,7 +99,8 @@ class InventoryManager:
         batches = InventoryManager._get_fefo_batches(product_id)
 
         remaining = int(qty_needed)
-        deductions: List[Dict[str, int]] = []
+        if deductions is None:
+            deductions = []
 
         for batch in batches:
             if remaining <= 0:
@@ -2,537 +2,855 @@
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
-from reportlab.platypus import (
-    SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer,
-    Image, PageBreak, KeepTogether, HRFlowable
-)
+from reportlab.rl_config import _FUZZ
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, Paragraph, KeepTogether
 from datetime import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import IO, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import copy
+import hashlib
+import json
 import os
+import tempfile
 from io import BytesIO
 
+from utils.cache import LRUCache
 from utils.pdf_styles import (
     PDFColors, PDFStyles, PDFTableStyles,
     PDFLayoutHelpers, PDFBranding
 )
 
+# Finished PDFs stay in memory up to this size, then spill to a temp file
+_SPOOL_MAX_SIZE = 512 * 1024
+
+# Finished PDFs keyed by (report title, digest of report_data). Identical
+# data yields an identical document, so entries only expire to keep the
+# "Generated on" footer reasonably fresh. Only PDFs up to _SPOOL_MAX_SIZE
+# are kept, which bounds the cache at maxsize * _SPOOL_MAX_SIZE bytes.
+_PDF_CACHE = LRUCache(maxsize=64, ttl=300)
+
+# Row caps for the data tables; the JSON endpoints carry the full data sets
+_MAX_TABLE_ROWS = 100
+_SALES_PREVIEW_ROWS = 50
+
+# Very long tables are emitted as several tables of at most this many rows
+_TABLE_CHUNK_ROWS = 500
+
+# Page setup shared by every report. Page streams are always Flate-compressed
+# (regardless of any site-wide rl_config override), and invariant output keeps
+# the bytes for the same input deterministic.
+_DOC_KW = dict(
+    pagesize=letter,
+    topMargin=0.5 * inch,
+    bottomMargin=0.8 * inch,
+    leftMargin=0.75 * inch,
+    rightMargin=0.75 * inch,
+    pageCompression=1,
+    invariant=1
+)
 
-def _footer_canvas(canvas, doc):
-    """Draw footer on every page at the bottom"""
-    canvas.saveState()
+# Footer offsets relative to the bottom margin (precomputed, used on every page)
+_FOOTER_DY_OFFSET = -0.3 * inch
+_FOOTER_DY_LINE = 0.2 * inch
+_FOOTER_DY_TEXT = -0.15 * inch
 
-    footer_y = doc.bottomMargin - 0.3 * inch
 
-    canvas.setStrokeColor(PDFColors.GOLD_ACCENT)
-    canvas.setLineWidth(0.5)
-    canvas.line(
-        doc.leftMargin,
-        footer_y + 0.2 * inch,
-        doc.width + doc.leftMargin,
-        footer_y + 0.2 * inch
-    )
+_FOOTER_FONT = 'Helvetica'
+_FOOTER_FONT_SIZE = 9
+_FOOTER_BRAND_TEXT = f"{PDFBranding.COMPANY_NAME} | {PDFBranding.BRANCH_NAME}"
 
-    timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
-    canvas.setFont('Helvetica', 9)
-    canvas.setFillColor(PDFColors.MEDIUM_GRAY)
-    canvas.drawCentredString(
-        (doc.width + doc.leftMargin + doc.rightMargin) / 2,
-        footer_y,
-        f"Generated on {timestamp}"
-    )
 
-    footer_text = f"{PDFBranding.COMPANY_NAME} | {PDFBranding.BRANCH_NAME}"
-    canvas.drawCentredString(
-        (doc.width + doc.leftMargin + doc.rightMargin) / 2,
-        footer_y - 0.15 * inch,
-        footer_text
-    )
+def _make_footer_canvas(doc):
+    """
+    Build the per-page footer callback for one document.
+    The timestamp and coordinates are fixed per build, so they are computed
+    here once and every page of the report shows the same generation time.
+    """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    generated_text = f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
+    center_x = (doc.width + doc.leftMargin + doc.rightMargin) / 2
+    footer_y = doc.bottomMargin + _FOOTER_DY_OFFSET
+    line_y = footer_y + _FOOTER_DY_LINE
+    line_x0 = doc.leftMargin
+    line_x1 = doc.width + doc.leftMargin
+    brand_y = footer_y + _FOOTER_DY_TEXT
+
+    # Both lines are centred, so their start x is fixed for the whole document
+    generated_x = center_x - stringWidth(generated_text, _FOOTER_FONT, _FOOTER_FONT_SIZE) / 2
+    brand_x = center_x - stringWidth(_FOOTER_BRAND_TEXT, _FOOTER_FONT, _FOOTER_FONT_SIZE) / 2
+
+    def _footer_canvas(canvas, doc):
+        """Draw footer on every page: one stroked rule and one text object"""
+        canvas.saveState()
+
+        canvas.setStrokeColor(PDFColors.GOLD_ACCENT)
+        canvas.setLineWidth(0.5)
+        canvas.line(line_x0, line_y, line_x1, line_y)
+
+        text = canvas.beginText(generated_x, footer_y)
+        text.setFont(_FOOTER_FONT, _FOOTER_FONT_SIZE)
+        text.setFillColor(PDFColors.MEDIUM_GRAY)
+        text.textOut(generated_text)
+        text.setTextOrigin(brand_x, brand_y)
+        text.textOut(_FOOTER_BRAND_TEXT)
+        canvas.drawText(text)
+
+        canvas.restoreState()
+
+    return _footer_canvas
+
+
+_STYLE_FACTORIES = {
+    'title': PDFStyles.get_title_style,
+    'subtitle': PDFStyles.get_subtitle_style,
+    'section': PDFStyles.get_section_header_style,
+    'body': PDFStyles.get_body_style,
+    'footer': PDFStyles.get_footer_style,
+    'metric_label': PDFStyles.get_metric_label_style,
+    'metric_value': PDFStyles.get_metric_value_style
+}
+
+
+# Shared, read-only style objects: Table.setStyle() only copies commands out of
+# a TableStyle, so one instance serves every table in every report.
+_STYLES = {name: factory() for name, factory in _STYLE_FACTORIES.items()}
+_SUMMARY_COL_WIDTHS = [3 * inch, 2.5 * inch]
+_SUMMARY_TABLE_STYLE = PDFTableStyles.get_summary_table_style()
+_STANDARD_TABLE_STYLE = PDFTableStyles.get_standard_table_style()
+_GOLD_BORDER_LINE = PDFLayoutHelpers.create_gold_border_line()
+
+
+class _StaticParagraph(Paragraph):
+    """
+    Paragraph whose text and style never change.
+    Line breaking depends only on the available width, so the result of
+    wrap() is memoised per width in a dict that every shallow copy shares.
+    """
 
-    canvas.restoreState()
+    def __init__(self, text, style):
+        super().__init__(text, style)
+        self._wrap_memo = {}
 
+    def wrap(self, availWidth, availHeight):
+        if availWidth < _FUZZ:
+            return super().wrap(availWidth, availHeight)
+        memo = self._wrap_memo.get(availWidth)
+        if memo is None:
+            super().wrap(availWidth, availHeight)
+            memo = (self._wrapWidths, self.blPara, self.height)
+            self._wrap_memo[availWidth] = memo
+        self.width = availWidth
+        self._wrapWidths, self.blPara, self.height = memo
+        return self.width, self.height
 
-class PDFReportGenerator:
+
+@lru_cache(maxsize=32)
+def _make_para(text, style_name):
+    """Parse the markup of a constant paragraph once per process."""
+    return _StaticParagraph(text, _STYLES[style_name])
+
+
+def _static_para(text, style_name):
     """
-    Professional PDF report generator for all 7 StockaDoodle reports
+    Return a copy of a cached constant paragraph.
+    ReportLab stores layout state on the flowable during wrap(), so every
+    document gets its own shallow copy sharing the already-parsed fragments.
     """
+    return copy.copy(_make_para(text, style_name))
 
-    def __init__(self):
-        self.styles = self._init_styles()
 
-    # ------------------------------------------------------------
-    # Small helpers
-    # ------------------------------------------------------------
-    @staticmethod
-    def _money(value) -> str:
-        """Format money consistently as Philippine Peso (₱)."""
-        try:
-            return f"₱{float(value or 0):,.2f}"
-        except Exception:
-            return "₱0.00"
+_LOGO_SIZE = 1.5 * inch
+_LOGO_CANDIDATES = (
+    PDFBranding.LOGO_PATH,
+    PDFBranding.LOGO_FALLBACK_PATH,
+    "../desktop_app/assets/icons/stockadoodle-transparent.png",
+    "../../desktop_app/assets/icons/stockadoodle-transparent.png",
+)
 
-    @staticmethod
-    def _safe_int(value) -> int:
-        try:
-            return int(value or 0)
-        except Exception:
-            return 0
 
-    @staticmethod
-    def _safe_float(value) -> float:
+@lru_cache(maxsize=1)
+def _load_logo_bytes():
+    """
+    Read the first usable logo once per process.
+    Returns the raw file bytes, or None when no candidate exists or decodes,
+    so the filesystem is never probed again for later reports.
+    """
+    from reportlab.lib.utils import ImageReader
+
+    for logo_path in _LOGO_CANDIDATES:
+        if not os.path.exists(logo_path):
+            continue
         try:
-            return float(value or 0)
+            with open(logo_path, 'rb') as fh:
+                data = fh.read()
+            ImageReader(BytesIO(data)).getSize()
+            return data
         except Exception:
-            return 0.0
-
-    def _init_styles(self):
-        """Initialize all paragraph styles"""
-        return {
-            'title': PDFStyles.get_title_style(),
-            'subtitle': PDFStyles.get_subtitle_style(),
-            'section': PDFStyles.get_section_header_style(),
-            'body': PDFStyles.get_body_style(),
-            'footer': PDFStyles.get_footer_style(),
-            'metric_label': PDFStyles.get_metric_label_style(),
-            'metric_value': PDFStyles.get_metric_value_style()
-        }
+            continue
+    return None
 
-    def _add_professional_header(self, elements):
-        """Add professional header with logo and company branding"""
-        logo_paths = [
-            PDFBranding.LOGO_PATH,
-            PDFBranding.LOGO_FALLBACK_PATH,
-            "../desktop_app/assets/icons/stockadoodle-transparent.png",
-            "../../desktop_app/assets/icons/stockadoodle-transparent.png",
-        ]
-
-        for logo_path in logo_paths:
-            if os.path.exists(logo_path):
-                try:
-                    logo = Image(logo_path, width=1.5 * inch, height=1.5 * inch)
-                    logo.hAlign = 'CENTER'
-                    elements.append(logo)
-                    elements.append(PDFLayoutHelpers.create_spacer(0.1))
-                    break
-                except Exception:
-                    continue
-
-        company_para = Paragraph(
-            f"<b>{PDFBranding.COMPANY_NAME}</b>",
-            self.styles['title']
-        )
-        elements.append(company_para)
 
-        branch_para = Paragraph(
-            f'<font color="{PDFColors.MEDIUM_GRAY}">{PDFBranding.BRANCH_NAME}</font>',
-            self.styles['subtitle']
-        )
-        elements.append(branch_para)
+# Bound str.format methods: the format spec is parsed once, not per cell
+_format_money = '₱{:,.2f}'.format
+_format_thousands = '{:,}'.format
+_format_units = '{:,} units'.format
+_format_percent = '{:.1f}%'.format
 
-        elements.append(PDFLayoutHelpers.create_gold_border_line())
-        elements.append(PDFLayoutHelpers.create_spacer(0.25))
 
-    def _add_report_title(self, elements, title, subtitle=None):
-        """Add report-specific title section"""
-        elements.append(Paragraph(title, self.styles['title']))
-        if subtitle:
-            elements.append(Paragraph(subtitle, self.styles['subtitle']))
-        elements.append(PDFLayoutHelpers.create_spacer(0.2))
+def _money(value: Any) -> str:
+    """Format money consistently as Philippine Peso (₱)."""
+    try:
+        return _format_money(float(value or 0))
+    except Exception:
+        return "₱0.00"
 
-    def _add_professional_footer(self, elements):
-        """Footer spacing (actual footer drawn via canvas callback)"""
-        elements.append(PDFLayoutHelpers.create_spacer(0.5))
 
-    def _create_summary_box(self, summary_data):
-        """Create styled summary metrics box"""
-        data = [[label, value] for label, value in summary_data.items()]
-        table = Table(data, colWidths=[3 * inch, 2.5 * inch])
-        table.setStyle(PDFTableStyles.get_summary_table_style())
-        return table
+def _safe_int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except Exception:
+        return 0
 
-    def _create_data_table(self, data, col_widths=None):
-        """Create professional data table"""
-        table = Table(data, colWidths=col_widths)
-        table.setStyle(PDFTableStyles.get_standard_table_style())
-        return table
 
-    # ================================================================
-    # REPORT 1 (Sales Performance)
-    # ================================================================
-    def generate_sales_performance_report(self, report_data):
-        """
-        Report 1 PDF: Sales Performance Report
-        Uses report_data from ReportGenerator.sales_performance_report()
-        """
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch,
-            bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch,
-            rightMargin=0.75 * inch
-        )
-        elements = []
+def _safe_float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except Exception:
+        return 0.0
 
-        self._add_professional_header(elements)
 
-        start_date = (report_data.get('date_range') or {}).get('start')
-        end_date = (report_data.get('date_range') or {}).get('end')
-        date_range = f"{start_date} to {end_date}" if start_date and end_date else "Not specified"
+def _fmt_count(value: Any) -> str:
+    return str(_safe_int(value))
 
-        # ✅ FIX: Correct title for Report 1
-        self._add_report_title(elements, "Sales Performance Report", f"Report Period: {date_range}")
 
-        elements.append(Paragraph("Summary", self.styles['section']))
+def _fmt_thousands(value: Any) -> str:
+    return _format_thousands(_safe_int(value))
 
-        summary = report_data.get('summary', {}) or {}
-        summary_data = {
-            'Total Income': self._money(summary.get('total_income', 0)),
-            'Total Quantity Sold': f"{self._safe_int(summary.get('total_quantity_sold', 0)):,}",
-            'Total Transactions': f"{self._safe_int(summary.get('total_transactions', 0)):,}"
-        }
 
-        elements.append(self._create_summary_box(summary_data))
-        elements.append(PDFLayoutHelpers.create_spacer(0.3))
+def _fmt_units(value: Any) -> str:
+    return _format_units(_safe_int(value))
 
-        sales_rows = report_data.get('sales') or []
-        if sales_rows:
-            elements.append(Paragraph("Sales Details", self.styles['section']))
 
-            sales_data = [['Sale ID', 'Date', 'Product', 'Qty', 'Line Total', 'Retailer']]
+def _fmt_percent(value: Any) -> str:
+    return _format_percent(_safe_float(value))
 
-            for sale in sales_rows[:50]:
-                sales_data.append([
-                    str(sale.get('sale_id', 'N/A')),
-                    (sale.get('date', 'N/A') or 'N/A')[:10],
-                    (sale.get('product_name', 'N/A') or 'N/A')[:25],
-                    str(self._safe_int(sale.get('quantity_sold', 0))),
-                    self._money(sale.get('total_price', 0)),
-                    (sale.get('retailer_name', 'N/A') or 'N/A')[:20]
-                ])
 
-            sales_table = self._create_data_table(
-                sales_data,
-                col_widths=[0.7 * inch, 1.0 * inch, 2.1 * inch, 0.6 * inch, 1.1 * inch, 1.5 * inch]
-            )
-            elements.append(sales_table)
-        else:
-            elements.append(Paragraph("No sales found for the selected period.", self.styles['body']))
+def _as_is(value: Any) -> Any:
+    return value
 
-        self._add_professional_footer(elements)
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+def _capitalized(value: Optional[str]) -> str:
+    return (value or '').capitalize()
 
-    # ================================================================
-    # REPORT 2 (Category Distribution)
-    # ================================================================
-    def generate_category_distribution_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
-        elements = []
 
-        self._add_professional_header(elements)
-        self._add_report_title(elements, "Category Distribution Report")
+def _or(fallback: str) -> Callable[[Any], Any]:
+    """Cell formatter: the value, or `fallback` when it is empty"""
+    return lambda value: value or fallback
 
-        summary = report_data.get('summary', {}) or {}
-        summary_text = {
-            'Total Categories': str(self._safe_int(summary.get('total_categories', 0))),
-            'Total Stock': f"{self._safe_int(summary.get('total_stock', 0)):,} units"
-        }
-        elements.append(Paragraph("Summary", self.styles['section']))
-        elements.append(self._create_summary_box(summary_text))
-        elements.append(PDFLayoutHelpers.create_spacer(0.3))
-
-        elements.append(Paragraph("Category Breakdown", self.styles['section']))
-        cat_data = [['Category', 'Products', 'Stock Quantity', 'Share']]
-
-        for cat in report_data.get('categories', []) or []:
-            cat_data.append([
-                cat.get('category_name', 'Unknown'),
-                str(self._safe_int(cat.get('number_of_products', 0))),
-                f"{self._safe_int(cat.get('total_stock_quantity', 0)):,}",
-                f"{self._safe_float(cat.get('percentage_share', 0)):.1f}%"
-            ])
-
-        cat_table = self._create_data_table(
-            cat_data,
-            col_widths=[2.5 * inch, 1.5 * inch, 1.5 * inch, 1.5 * inch]
-        )
-        elements.append(cat_table)
 
-        self._add_professional_footer(elements)
+def _clip(width: int, fallback: str) -> Callable[[Optional[str]], str]:
+    """Cell formatter: the value (or `fallback` when empty) cut to `width` characters"""
+    return lambda value: (value or fallback)[:width]
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
 
-    # ================================================================
-    # REPORT 3 (Retailer Performance)
-    # ================================================================
-    def generate_retailer_performance_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
-        elements = []
+def _row_builder(*fields: Tuple[str, Any, Callable[[Any], Any]]) -> Callable[[Dict[str, Any]], List[Any]]:
+    """
+    Compile (key, default, formatter) column definitions into a row function.
+    Every field is fetched with a single itemgetter call; rows that lack one
+    of the keys fall back to dict.get() with the column's default.
+    """
+    fetch = itemgetter(*(key for key, _, _ in fields))
+    fallbacks = tuple((key, default) for key, default, _ in fields)
+    formatters = tuple(fmt for _, _, fmt in fields)
 
-        self._add_professional_header(elements)
-        self._add_report_title(elements, "Retailer Performance Report")
+    def build_row(row: Dict[str, Any]) -> List[Any]:
+        try:
+            values = fetch(row)
+        except KeyError:
+            get = row.get
+            values = [get(key, default) for key, default in fallbacks]
+        return [fmt(value) for fmt, value in zip(formatters, values)]
 
-        summary = report_data.get('summary', {}) or {}
-        summary_text = {
-            'Total Retailers': str(self._safe_int(summary.get('total_retailers', 0))),
-            'Active Today': str(self._safe_int(summary.get('active_today', 0)))
-        }
+    return build_row
 
-        elements.append(Paragraph("Summary", self.styles['section']))
-        elements.append(self._create_summary_box(summary_text))
-        elements.append(PDFLayoutHelpers.create_spacer(0.3))
-
-        elements.append(Paragraph("Performance Metrics", self.styles['section']))
-        ret_data = [['Retailer', 'Daily Quota', "Today's Sales", 'Progress', 'Streak', 'Total Sales']]
-
-        for ret in report_data.get('retailers', []) or []:
-            ret_data.append([
-                (ret.get('retailer_name', 'Unknown') or 'Unknown')[:25],
-                self._money(ret.get('daily_quota', 0)),
-                self._money(ret.get('current_sales', 0)),
-                f"{self._safe_float(ret.get('quota_progress', 0)):.1f}%",
-                str(self._safe_int(ret.get('streak_count', 0))),
-                self._money(ret.get('total_sales', 0)),
-            ])
-
-        ret_table = self._create_data_table(
-            ret_data,
-            col_widths=[2 * inch, 1 * inch, 1 * inch, 0.8 * inch, 0.7 * inch, 1 * inch]
-        )
-        elements.append(ret_table)
 
-        self._add_professional_footer(elements)
+class ReportInput(NamedTuple):
+    """
+    report_data normalised once per build, so layout code reads plain
+    attributes instead of repeating defensive .get() chains.
+    """
+    summary: Dict[str, Any]
+    rows: List[Dict[str, Any]]
+    start: Any
+    end: Any
+    total_rows: int  # rows in the full data set, before any cap
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
 
-    # ================================================================
-    # REPORT 4 (Alerts)
-    # ================================================================
-    def generate_alerts_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
-        elements = []
+def _date_range_text(data: ReportInput, missing: str) -> str:
+    """'start to end' for the report period, or `missing` if either end is unset"""
+    return f"{data.start} to {data.end}" if data.start and data.end else missing
 
-        self._add_professional_header(elements)
-        self._add_report_title(elements, "Low-Stock & Expiration Alert Report")
 
-        summary = report_data.get('summary', {}) or {}
-        summary_text = {
-            'Total Alerts': str(self._safe_int(summary.get('total_alerts', 0))),
-            'Critical': str(self._safe_int(summary.get('critical_alerts', 0))),
-            'Warning': str(self._safe_int(summary.get('warning_alerts', 0)))
-        }
+@dataclass(frozen=True)
+class ReportSpec:
+    """
+    Declarative layout of one report. Everything that differs between the
+    seven PDFs lives here; PDFReportGenerator._build_report() does the rest.
+    """
+    title: str
+    summary_fields: Tuple[Tuple[str, str, Callable], ...]  # (label, summary key, formatter)
+    rows_key: str
+    table_label: str
+    columns: Tuple[str, ...]
+    col_widths: Tuple[float, ...]
+    row: Callable  # row dict -> list of cell strings, see _row_builder()
+    row_limit: int = _MAX_TABLE_ROWS
+    total_key: Optional[str] = None  # summary key counting every row, for the "Showing N of M" note
+    summary_label: str = "Summary"
+    subtitle: Optional[Callable] = None  # ReportInput -> subtitle text
+    period_banner: Optional[Callable] = None  # ReportInput -> text drawn under the summary
+    empty_message: Optional[str] = None  # shown instead of the table when there are no rows
+    chunked: bool = False
+
+
+# ================================================================
+# REPORT 1 (Sales Performance)
+# ================================================================
+_SALES_PERFORMANCE_SPEC = ReportSpec(
+    title="Sales Performance Report",
+    subtitle=lambda d: f"Report Period: {_date_range_text(d, 'Not specified')}",
+    summary_fields=(
+        ('Total Income', 'total_income', _money),
+        ('Total Quantity Sold', 'total_quantity_sold', _fmt_thousands),
+        ('Total Transactions', 'total_transactions', _fmt_thousands),
+    ),
+    rows_key='sales',
+    total_key='total_lines',
+    row_limit=_SALES_PREVIEW_ROWS,
+    table_label="Sales Details",
+    columns=('Sale ID', 'Date', 'Product', 'Qty', 'Line Total', 'Retailer'),
+    col_widths=(0.7 * inch, 1.0 * inch, 2.1 * inch, 0.6 * inch, 1.1 * inch, 1.5 * inch),
+    row=_row_builder(
+        ('sale_id', 'N/A', str),
+        ('date', None, _clip(10, 'N/A')),
+        ('product_name', None, _clip(25, 'N/A')),
+        ('quantity_sold', None, _fmt_count),
+        ('total_price', None, _money),
+        ('retailer_name', None, _clip(20, 'N/A')),
+    ),
+    empty_message="No sales found for the selected period.",
+)
 
-        elements.append(Paragraph("Alert Summary", self.styles['section']))
-        elements.append(self._create_summary_box(summary_text))
-        elements.append(PDFLayoutHelpers.create_spacer(0.3))
-
-        elements.append(Paragraph("Alert Details", self.styles['section']))
-        alert_data = [['Product', 'Current Stock', 'Min Level', 'Expiration', 'Status', 'Severity']]
-
-        for alert in report_data.get('alerts', []) or []:
-            alert_data.append([
-                (alert.get('product_name', 'Unknown') or 'Unknown')[:30],
-                str(self._safe_int(alert.get('current_stock', 0))),
-                str(self._safe_int(alert.get('min_stock_level', 0))),
-                alert.get('expiration_date') or 'N/A',
-                alert.get('alert_status', '') or '',
-                alert.get('severity', '') or ''
-            ])
-
-        alert_table = self._create_data_table(
-            alert_data,
-            col_widths=[2 * inch, 1 * inch, 0.9 * inch, 1 * inch, 1.5 * inch, 0.8 * inch]
-        )
-        elements.append(alert_table)
 
-        self._add_professional_footer(elements)
+# ================================================================
+# REPORT 2 (Category Distribution)
+# ================================================================
+_CATEGORY_DISTRIBUTION_SPEC = ReportSpec(
+    title="Category Distribution Report",
+    summary_fields=(
+        ('Total Categories', 'total_categories', _fmt_count),
+        ('Total Stock', 'total_stock', _fmt_units),
+    ),
+    rows_key='categories',
+    total_key='total_categories',
+    table_label="Category Breakdown",
+    columns=('Category', 'Products', 'Stock Quantity', 'Share'),
+    col_widths=(2.5 * inch, 1.5 * inch, 1.5 * inch, 1.5 * inch),
+    row=_row_builder(
+        ('category_name', 'Unknown', _as_is),
+        ('number_of_products', None, _fmt_count),
+        ('total_stock_quantity', None, _fmt_thousands),
+        ('percentage_share', None, _fmt_percent),
+    ),
+)
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
 
-    # ================================================================
-    # REPORT 5 (Managerial Activity)
-    # ================================================================
-    def generate_managerial_activity_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
+# ================================================================
+# REPORT 3 (Retailer Performance)
+# ================================================================
+_RETAILER_PERFORMANCE_SPEC = ReportSpec(
+    title="Retailer Performance Report",
+    summary_fields=(
+        ('Total Retailers', 'total_retailers', _fmt_count),
+        ('Active Today', 'active_today', _fmt_count),
+    ),
+    rows_key='retailers',
+    total_key='total_retailers',
+    table_label="Performance Metrics",
+    columns=('Retailer', 'Daily Quota', "Today's Sales", 'Progress', 'Streak', 'Total Sales'),
+    col_widths=(2 * inch, 1 * inch, 1 * inch, 0.8 * inch, 0.7 * inch, 1 * inch),
+    row=_row_builder(
+        ('retailer_name', None, _clip(25, 'Unknown')),
+        ('daily_quota', None, _money),
+        ('current_sales', None, _money),
+        ('quota_progress', None, _fmt_percent),
+        ('streak_count', None, _fmt_count),
+        ('total_sales', None, _money),
+    ),
+)
+
+
+# ================================================================
+# REPORT 4 (Alerts)
+# ================================================================
+_ALERTS_SPEC = ReportSpec(
+    title="Low-Stock & Expiration Alert Report",
+    summary_label="Alert Summary",
+    summary_fields=(
+        ('Total Alerts', 'total_alerts', _fmt_count),
+        ('Critical', 'critical_alerts', _fmt_count),
+        ('Warning', 'warning_alerts', _fmt_count),
+    ),
+    rows_key='alerts',
+    total_key='total_alerts',
+    table_label="Alert Details",
+    columns=('Product', 'Current Stock', 'Min Level', 'Expiration', 'Status', 'Severity'),
+    col_widths=(2 * inch, 1 * inch, 0.9 * inch, 1 * inch, 1.5 * inch, 0.8 * inch),
+    row=_row_builder(
+        ('product_name', None, _clip(30, 'Unknown')),
+        ('current_stock', None, _fmt_count),
+        ('min_stock_level', None, _fmt_count),
+        ('expiration_date', None, _or('N/A')),
+        ('alert_status', None, _or('')),
+        ('severity', None, _or('')),
+    ),
+)
+
+
+# ================================================================
+# REPORT 5 (Managerial Activity)
+# ================================================================
+def _managerial_activity_subtitle(data: ReportInput) -> str:
+    date_range = f"{data.start or ''} to {data.end or ''}".strip()
+    return f"Report Period: {date_range}"
+
+
+_MANAGERIAL_ACTIVITY_SPEC = ReportSpec(
+    title="Managerial Activity Log Report",
+    subtitle=_managerial_activity_subtitle,
+    summary_fields=(
+        ('Total Actions', 'total_actions', _fmt_count),
+        ('Unique Managers', 'unique_managers', _fmt_count),
+    ),
+    rows_key='logs',
+    total_key='total_actions',
+    table_label="Activity Log",
+    columns=('Log ID', 'Product', 'Action', 'Manager', 'Date/Time'),
+    col_widths=(0.7 * inch, 2 * inch, 1.3 * inch, 1.5 * inch, 1.5 * inch),
+    row=_row_builder(
+        ('log_id', '', str),
+        ('product_name', None, _clip(25, 'Unknown')),
+        ('action_performed', None, _or('')),
+        ('manager_name', None, _clip(20, 'Unknown')),
+        ('date_time', None, _clip(16, '')),
+    ),
+)
+
+
+# ================================================================
+# REPORT 6 (Detailed Transactions)
+# ================================================================
+_TRANSACTIONS_SPEC = ReportSpec(
+    title="Detailed Sales Transaction Report",
+    summary_fields=(
+        ('Total Revenue', 'total_revenue', _money),
+        ('Total Transactions', 'total_transactions', _fmt_thousands),
+        ('Total Sales Count', 'total_sales_count', _fmt_thousands),
+        ('Total Items Sold', 'total_items_sold', _fmt_thousands),
+    ),
+    period_banner=lambda d: f"Report Period: {_date_range_text(d, 'Not Specified')}",
+    rows_key='transactions',
+    total_key='total_transactions',
+    table_label="Sales Breakdown",
+    columns=('Sale ID', 'Product', 'Brand', 'Qty', 'Unit Price', 'Line Total', 'Retailer'),
+    col_widths=(0.8 * inch, 2 * inch, 1 * inch, 0.7 * inch, 1 * inch, 1 * inch, 1.5 * inch),
+    row=_row_builder(
+        ('sale_id', '', str),
+        ('product_name', None, _clip(30, 'Unknown')),
+        ('product_brand', None, _clip(15, '')),
+        ('quantity_sold', None, _fmt_count),
+        ('unit_price', None, _money),
+        ('line_total', None, _money),
+        ('retailer_name', None, _clip(25, 'Unknown')),
+    ),
+    chunked=True,
+)
+
+
+# ================================================================
+# REPORT 7 (User Accounts)
+# ================================================================
+_USER_ACCOUNTS_SPEC = ReportSpec(
+    title="User Accounts Report",
+    summary_fields=(
+        ('Total Users', 'total_users', _fmt_count),
+        ('Admins', 'admins', _fmt_count),
+        ('Managers', 'managers', _fmt_count),
+        ('Retailers', 'retailers', _fmt_count),
+    ),
+    rows_key='users',
+    total_key='total_users',
+    table_label="User Details",
+    columns=('User ID', 'Username', 'Full Name', 'Role', 'Status'),
+    col_widths=(0.8 * inch, 1.5 * inch, 2 * inch, 1.2 * inch, 1.2 * inch),
+    row=_row_builder(
+        ('user_id', '', str),
+        ('username', None, _clip(20, '')),
+        ('full_name', None, _clip(25, '')),
+        ('role', None, _capitalized),
+        ('account_status', 'Unknown', _as_is),
+    ),
+)
+
+
+# Report key -> layout spec, used to look up default row caps
+_REPORT_SPECS = {
+    'sales_performance': _SALES_PERFORMANCE_SPEC,
+    'category_distribution': _CATEGORY_DISTRIBUTION_SPEC,
+    'retailer_performance': _RETAILER_PERFORMANCE_SPEC,
+    'alerts': _ALERTS_SPEC,
+    'managerial_activity': _MANAGERIAL_ACTIVITY_SPEC,
+    'transactions': _TRANSACTIONS_SPEC,
+    'user_accounts': _USER_ACCOUNTS_SPEC,
+}
+
+# Report key -> generator method, used by generate_all()
+_REPORT_METHODS = {
+    'sales_performance': 'generate_sales_performance_report',
+    'category_distribution': 'generate_category_distribution_report',
+    'retailer_performance': 'generate_retailer_performance_report',
+    'alerts': 'generate_alerts_report',
+    'managerial_activity': 'generate_managerial_activity_report',
+    'transactions': 'generate_transactions_report',
+    'user_accounts': 'generate_user_accounts_report',
+}
+
+
+def _render_report_bytes(report_key: str, report_data: Dict[str, Any]) -> bytes:
+    """
+    Worker entry point for generate_all(): build one report and return its
+    bytes (file objects cannot cross the process boundary).
+    """
+    stream = getattr(PDFReportGenerator(), _REPORT_METHODS[report_key])(report_data)
+    try:
+        return stream.read()
+    finally:
+        stream.close()
+
+
+class PDFReportGenerator:
+    """
+    Professional PDF report generator for all 7 StockaDoodle reports
+    """
+
+    def __init__(self):
+        self.styles = _STYLES
+
+    # ------------------------------------------------------------
+    # Small helpers
+    # ------------------------------------------------------------
+    _money = staticmethod(_money)
+    _safe_int = staticmethod(_safe_int)
+    _safe_float = staticmethod(_safe_float)
+
+    @staticmethod
+    def clear_cache():
+        """Drop every cached PDF"""
+        _PDF_CACHE.clear()
+
+    @staticmethod
+    def row_limit(report_key):
+        """
+        Default number of table rows rendered for a report. Callers can pass
+        it on to the data query so no more rows are fetched than get drawn.
+        """
+        return _REPORT_SPECS[report_key].row_limit
+
+    @staticmethod
+    def _cache_key(spec, report_data, row_limit):
+        """Stable key for a report: title, row cap and a digest of the sorted JSON data"""
+        payload = json.dumps(report_data, sort_keys=True, default=str).encode('utf-8')
+        return spec.title, row_limit, hashlib.blake2b(payload, digest_size=16).digest()
+
+    @staticmethod
+    def _normalize(spec, report_data, row_limit):
+        """Resolve the optional parts of report_data once into a ReportInput"""
+        get = report_data.get
+        date_range = get('date_range') or {}
+        summary = get('summary') or {}
+        rows = get(spec.rows_key) or []
+
+        # Rows may already have been capped upstream; the summary still counts them all
+        total_rows = len(rows)
+        if spec.total_key:
+            try:
+                total_rows = max(total_rows, int(summary.get(spec.total_key) or 0))
+            except (TypeError, ValueError):
+                pass
+
+        return ReportInput(
+            summary=summary,
+            rows=rows[:row_limit],
+            start=date_range.get('start'),
+            end=date_range.get('end'),
+            total_rows=total_rows,
         )
-        elements = []
 
-        self._add_professional_header(elements)
+    @staticmethod
+    def _open_output(out_stream=None):
+        """Target stream for doc.build(): caller-supplied or a spooled temp file"""
+        if out_stream is not None:
+            return out_stream
+        return tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
 
-        dr = report_data.get('date_range', {}) or {}
-        date_range = f"{dr.get('start', '')} to {dr.get('end', '')}".strip()
+    @staticmethod
+    def _rewind(out_stream):
+        """Rewind the finished PDF so callers (e.g. send_file) read from the start"""
+        if out_stream.seekable():
+            out_stream.seek(0)
+        return out_stream
 
-        self._add_report_title(elements, "Managerial Activity Log Report", f"Report Period: {date_range}")
+    def _add_professional_header(self, elements):
+        """Add professional header with logo and company branding"""
+        logo_bytes = _load_logo_bytes()
+        if logo_bytes is not None:
+            from reportlab.platypus import Image
 
-        summary = report_data.get('summary', {}) or {}
-        summary_text = {
-            'Total Actions': str(self._safe_int(summary.get('total_actions', 0))),
-            'Unique Managers': str(self._safe_int(summary.get('unique_managers', 0)))
-        }
+            logo = Image(BytesIO(logo_bytes), width=_LOGO_SIZE, height=_LOGO_SIZE)
+            logo.hAlign = 'CENTER'
+            elements.append(logo)
+            elements.append(PDFLayoutHelpers.create_spacer(0.1))
 
-        elements.append(Paragraph("Summary", self.styles['section']))
-        elements.append(self._create_summary_box(summary_text))
-        elements.append(PDFLayoutHelpers.create_spacer(0.3))
-
-        elements.append(Paragraph("Activity Log", self.styles['section']))
-        log_data = [['Log ID', 'Product', 'Action', 'Manager', 'Date/Time']]
-
-        for log in (report_data.get('logs', []) or [])[:100]:
-            log_data.append([
-                str(log.get('log_id', '')),
-                (log.get('product_name', 'Unknown') or 'Unknown')[:25],
-                log.get('action_performed', '') or '',
-                (log.get('manager_name', 'Unknown') or 'Unknown')[:20],
-                (log.get('date_time', '') or '')[:16]
-            ])
-
-        log_table = self._create_data_table(
-            log_data,
-            col_widths=[0.7 * inch, 2 * inch, 1.3 * inch, 1.5 * inch, 1.5 * inch]
+        company_para = _static_para(
+            f"<b>{PDFBranding.COMPANY_NAME}</b>",
+            'title'
         )
-        elements.append(log_table)
+        elements.append(company_para)
 
-        self._add_professional_footer(elements)
+        branch_para = _static_para(
+            f'<font color="{PDFColors.MEDIUM_GRAY}">{PDFBranding.BRANCH_NAME}</font>',
+            'subtitle'
+        )
+        elements.append(branch_para)
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+        elements.append(copy.copy(_GOLD_BORDER_LINE))
+        elements.append(PDFLayoutHelpers.create_spacer(0.25))
 
-    # ================================================================
-    # REPORT 6 (Detailed Transactions)
-    # ================================================================
-    def generate_transactions_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
+    def _add_report_title(self, elements, title, subtitle=None):
+        """Add report-specific title section"""
+        elements.append(_static_para(title, 'title'))
+        if subtitle:
+            elements.append(Paragraph(subtitle, self.styles['subtitle']))
+        elements.append(PDFLayoutHelpers.create_spacer(0.2))
+
+    def _section(self, label):
+        """Section header flowable for a fixed label (parsed once, copied per report)"""
+        return _static_para(label, 'section')
+
+    def _add_professional_footer(self, elements):
+        """Footer spacing (actual footer drawn via canvas callback)"""
+        elements.append(PDFLayoutHelpers.create_spacer(0.5))
+
+    def _create_summary_box(self, summary_data):
+        """Create styled summary metrics box"""
+        data = [[label, value] for label, value in summary_data.items()]
+        table = Table(data, colWidths=_SUMMARY_COL_WIDTHS)
+        table.setStyle(_SUMMARY_TABLE_STYLE)
+        return table
+
+    def _make_summary_block(self, label, summary_data):
+        """Section header, summary box and trailing gap laid out as one group"""
+        return KeepTogether([
+            self._section(label),
+            self._create_summary_box(summary_data),
+            PDFLayoutHelpers.create_spacer(0.3),
+        ])
+
+    def _create_data_table(self, data, col_widths=None):
+        """
+        Create professional data table.
+        Row heights are fixed up front and the header repeats on every page,
+        so long tables split by row without re-measuring each cell.
+        """
+        row_heights = (
+            [PDFTableStyles.STANDARD_HEADER_ROW_HEIGHT]
+            + [PDFTableStyles.STANDARD_ROW_HEIGHT] * (len(data) - 1)
+        )
+        table = LongTable(
+            data,
+            colWidths=col_widths,
+            rowHeights=row_heights,
+            repeatRows=1,
+            splitByRow=1
         )
+        table.setStyle(_STANDARD_TABLE_STYLE)
+        return table
+
+    def _create_chunked_data_tables(self, data, col_widths=None, chunk_rows=_TABLE_CHUNK_ROWS):
+        """
+        Split a large data table into several tables of at most chunk_rows rows
+        (each repeating the header), separated by small spacers, so layout works
+        on one bounded table at a time instead of a single huge flowable.
+        """
+        header, rows = data[0], data[1:]
+        flowables = []
+        for start in range(0, max(len(rows), 1), chunk_rows):
+            if flowables:
+                flowables.append(PDFLayoutHelpers.create_spacer(0.1))
+            flowables.append(
+                self._create_data_table([header] + rows[start:start + chunk_rows], col_widths)
+            )
+        return flowables
+
+    def generate_all(self, report_data_map, max_workers=None):
+        """
+        Build several reports in parallel worker processes.
+
+        Args:
+            report_data_map (dict): Report key (see _REPORT_METHODS) -> report_data
+            max_workers (int, optional): Process count, defaults to one per report
+                up to the CPU count
+
+        Returns:
+            dict: Report key -> PDF bytes
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        unknown = set(report_data_map) - set(_REPORT_METHODS)
+        if unknown:
+            raise ValueError(f"Unknown report(s): {', '.join(sorted(unknown))}")
+        if not report_data_map:
+            return {}
+
+        workers = max_workers or min(len(report_data_map), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(_render_report_bytes, key, data)
+                for key, data in report_data_map.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    def _build_report(
+        self,
+        spec: ReportSpec,
+        report_data: Dict[str, Any],
+        out_stream: Optional[IO[bytes]] = None,
+        limit: Optional[int] = None
+    ) -> IO[bytes]:
+        """
+        Lay out one report from its ReportSpec:
+        header -> title -> summary box -> data table -> footer.
+
+        Writes into out_stream when given (any writable binary file object);
+        otherwise returns a spooled temp file that stays in memory for small
+        reports and spills to disk for large ones. The returned stream is
+        rewound and ready to read.
+
+        `limit` overrides the spec's default row cap for the data table.
+        """
+        row_limit = limit or spec.row_limit
+        cache_key = self._cache_key(spec, report_data, row_limit)
+        cached = _PDF_CACHE.get(cache_key)
+        if cached is not None:
+            buffer = self._open_output(out_stream)
+            buffer.write(cached)
+            return self._rewind(buffer)
+
+        buffer = self._open_output(out_stream)
+        doc = SimpleDocTemplate(buffer, **_DOC_KW)
         elements = []
 
         self._add_professional_header(elements)
+        data = self._normalize(spec, report_data, row_limit)
+        subtitle = spec.subtitle(data) if spec.subtitle else None
+        self._add_report_title(elements, spec.title, subtitle)
 
-        self._add_report_title(elements, "Detailed Sales Transaction Report")
-
-        summary = report_data.get('summary', {}) or {}
-        summary_text = {
-            'Total Revenue': self._money(summary.get('total_revenue', 0)),
-            'Total Transactions': f"{self._safe_int(summary.get('total_transactions', 0)):,}",
-            'Total Sales Count': f"{self._safe_int(summary.get('total_sales_count', 0)):,}",
-            'Total Items Sold': f"{self._safe_int(summary.get('total_items_sold', 0)):,}"
+        summary_get = data.summary.get
+        summary_data = {
+            label: fmt(summary_get(key))
+            for label, key, fmt in spec.summary_fields
         }
-
-        elements.append(Paragraph("Summary", self.styles['section']))
-        elements.append(self._create_summary_box(summary_text))
-        elements.append(PDFLayoutHelpers.create_spacer(0.3))
-
-        dr = report_data.get('date_range', {}) or {}
-        start_date = dr.get('start')
-        end_date = dr.get('end')
-        date_range = f"{start_date} to {end_date}" if start_date and end_date else "Not Specified"
-
-        elements.append(Paragraph(f"Report Period: {date_range}", self.styles['section']))
-        elements.append(PDFLayoutHelpers.create_spacer(0.3))
-
-        elements.append(Paragraph("Sales Breakdown", self.styles['section']))
-        sales_data = [['Sale ID', 'Product', 'Brand', 'Qty', 'Unit Price', 'Line Total', 'Retailer']]
-
-        for transaction in (report_data.get('transactions', []) or [])[:100]:
-            sales_data.append([
-                str(transaction.get('sale_id', '')),
-                (transaction.get('product_name', 'Unknown') or 'Unknown')[:30],
-                (transaction.get('product_brand', '') or '')[:15],
-                str(self._safe_int(transaction.get('quantity_sold', 0))),
-                self._money(transaction.get('unit_price', 0)),
-                self._money(transaction.get('line_total', 0)),
-                (transaction.get('retailer_name', 'Unknown') or 'Unknown')[:25]
-            ])
-
-        sales_table = self._create_data_table(
-            sales_data,
-            col_widths=[0.8 * inch, 2 * inch, 1 * inch, 0.7 * inch, 1 * inch, 1 * inch, 1.5 * inch]
-        )
-        elements.append(sales_table)
+        elements.append(self._make_summary_block(spec.summary_label, summary_data))
+
+        if spec.period_banner:
+            elements.append(Paragraph(spec.period_banner(data), self.styles['section']))
+            elements.append(PDFLayoutHelpers.create_spacer(0.3))
+
+        rows = data.rows
+        if rows or spec.empty_message is None:
+            elements.append(self._section(spec.table_label))
+
+            # Allocate the final table size once instead of growing it row by row
+            make_row = spec.row
+            table_data = [None] * (len(rows) + 1)
+            table_data[0] = list(spec.columns)
+            for i, row in enumerate(rows, 1):
+                table_data[i] = make_row(row)
+
+            col_widths = list(spec.col_widths)
+            if spec.chunked:
+                elements.extend(self._create_chunked_data_tables(table_data, col_widths))
+            else:
+                elements.append(self._create_data_table(table_data, col_widths))
+
+            # Say so when the table is capped, so it is not read as the full list
+            if len(rows) < data.total_rows:
+                elements.append(Paragraph(
+                    f"Showing {len(rows):,} of {data.total_rows:,} rows; "
+                    "the summary covers all of them.",
+                    self.styles['body']
+                ))
+        else:
+            elements.append(Paragraph(spec.empty_message, self.styles['body']))
 
         self._add_professional_footer(elements)
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+        footer = _make_footer_canvas(doc)
+        doc.build(elements, onFirstPage=footer, onLaterPages=footer)
+
+        # Keep a copy when the stream can be read back (caller streams may not)
+        # and the PDF is small enough to stay in memory; larger ones went to
+        # disk for a reason and are rebuilt instead
+        if buffer.seekable() and buffer.readable():
+            size = buffer.seek(0, os.SEEK_END)
+            if size <= _SPOOL_MAX_SIZE:
+                buffer.seek(0)
+                _PDF_CACHE.set(cache_key, buffer.read())
+        return self._rewind(buffer)
 
     # ================================================================
-    # REPORT 7 (User Accounts)
+    # Report entry points (see the ReportSpec definitions above)
     # ================================================================
-    def generate_user_accounts_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
-        elements = []
+    def generate_sales_performance_report(self, report_data, out_stream=None, limit=None):
+        """
+        Report 1 PDF: Sales Performance Report
+        Uses report_data from ReportGenerator.sales_performance_report()
+        """
+        return self._build_report(_SALES_PERFORMANCE_SPEC, report_data, out_stream, limit)
 
-        self._add_professional_header(elements)
-        self._add_report_title(elements, "User Accounts Report")
-
-        summary = report_data.get('summary', {}) or {}
-        summary_text = {
-            'Total Users': str(self._safe_int(summary.get('total_users', 0))),
-            'Admins': str(self._safe_int(summary.get('admins', 0))),
-            'Managers': str(self._safe_int(summary.get('managers', 0))),
-            'Retailers': str(self._safe_int(summary.get('retailers', 0)))
-        }
+    def generate_category_distribution_report(self, report_data, out_stream=None, limit=None):
+        """Report 2 PDF: Category Distribution Report"""
+        return self._build_report(_CATEGORY_DISTRIBUTION_SPEC, report_data, out_stream, limit)
 
-        elements.append(Paragraph("Summary", self.styles['section']))
-        elements.append(self._create_summary_box(summary_text))
-        elements.append(PDFLayoutHelpers.create_spacer(0.3))
-
-        elements.append(Paragraph("User Details", self.styles['section']))
-        user_data = [['User ID', 'Username', 'Full Name', 'Role', 'Status']]
-
-        for user in report_data.get('users', []) or []:
-            user_data.append([
-                str(user.get('user_id', '')),
-                (user.get('username', '') or '')[:20],
-                (user.get('full_name', '') or '')[:25],
-                (user.get('role', '') or '').capitalize(),
-                user.get('account_status', 'Unknown')
-            ])
-
-        user_table = self._create_data_table(
-            user_data,
-            col_widths=[0.8 * inch, 1.5 * inch, 2 * inch, 1.2 * inch, 1.2 * inch]
-        )
-        elements.append(user_table)
+    def generate_retailer_performance_report(self, report_data, out_stream=None, limit=None):
+        """Report 3 PDF: Retailer Performance Report"""
+        return self._build_report(_RETAILER_PERFORMANCE_SPEC, report_data, out_stream, limit)
 
-        self._add_professional_footer(elements)
+    def generate_alerts_report(self, report_data, out_stream=None, limit=None):
+        """Report 4 PDF: Low-Stock & Expiration Alert Report"""
+        return self._build_report(_ALERTS_SPEC, report_data, out_stream, limit)
+
+    def generate_managerial_activity_report(self, report_data, out_stream=None, limit=None):
+        """Report 5 PDF: Managerial Activity Log Report"""
+        return self._build_report(_MANAGERIAL_ACTIVITY_SPEC, report_data, out_stream, limit)
+
+    def generate_transactions_report(self, report_data, out_stream=None, limit=None):
+        """Report 6 PDF: Detailed Sales Transaction Report"""
+        return self._build_report(_TRANSACTIONS_SPEC, report_data, out_stream, limit)
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+    def generate_user_accounts_report(self, report_data, out_stream=None, limit=None):
+        """Report 7 PDF: User Accounts Report"""
+        return self._build_report(_USER_ACCOUNTS_SPEC, report_data, out_stream, limit)
@@ -8,6 +8,31 @@ from models.retailer_metrics import RetailerMetrics
 from models.product_log import ProductLog
 from models.stock_batch import StockBatch
 from datetime import datetime, date, timedelta
+from itertools import islice
+from mongoengine import signals
+from mongoengine.context_managers import no_dereference
+from utils.cache import LRUCache
+
+
+# First/last sale dates used when a report is requested without a date range
+_SALES_BOUNDS_CACHE = LRUCache(maxsize=1, ttl=60)
+
+# Small reference tables (users, categories) shared by reports rendered together
+_DIRECTORY_CACHE = LRUCache(maxsize=8, ttl=30)
+
+# Whole catalogue/user reports (2 and 7), keyed on their arguments
+_REPORT_CACHE = LRUCache(maxsize=16, ttl=60)
+
+
+def _on_reference_data_change(sender, document, **kwargs):
+    """Saving or deleting a product, batch, category or user invalidates cached reports"""
+    _REPORT_CACHE.clear()
+    _DIRECTORY_CACHE.clear()
+
+
+for _model in (Product, StockBatch, Category, User):
+    signals.post_save.connect(_on_reference_data_change, sender=_model)
+    signals.post_delete.connect(_on_reference_data_change, sender=_model)
 
 
 class ReportGenerator:
@@ -16,6 +41,15 @@ class ReportGenerator:
     Provides data for managerial decision-making and system auditing.
     """
 
+    # Sale fields read by the sales reports (batch deductions are never needed)
+    _SALE_ROW_FIELDS = (
+        'id', 'created_at', 'retailer_id',
+        'items.product_id', 'items.quantity', 'items.line_total'
+    )
+
+    # Documents fetched per round-trip when streaming report rows
+    _CURSOR_BATCH_SIZE = 500
+
     # ------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------
@@ -27,100 +61,395 @@ class ReportGenerator:
     def _date_to_end_datetime(d: date):
         return datetime.combine(d, datetime.max.time())
 
-    # ------------------------------------------------------------
-    # REPORT 1
-    # ------------------------------------------------------------
     @staticmethod
-    def sales_performance_report(start_date=None, end_date=None):
+    def _sales_date_bounds():
         """
-        Report 1: Sales Performance Report for a Selected Date Range
+        (first, last) sale dates, or (None, None) when there are no sales.
+        One min/max aggregation, memoised briefly so reports rendered together
+        share it; recording a sale clears it (see clear_cache).
+        """
+        bounds = _SALES_BOUNDS_CACHE.get('bounds')
+        if bounds is None:
+            pipeline = [{'$group': {'_id': None, 'first': {'$min': '$created_at'}, 'last': {'$max': '$created_at'}}}]
+            row = next(iter(Sale.objects.aggregate(pipeline)), None)
+            bounds = (row['first'].date(), row['last'].date()) if row and row['first'] else (None, None)
+            _SALES_BOUNDS_CACHE.set('bounds', bounds)
+        return bounds
 
-        Shows: Report ID, Date Range, Product Name, Quantity Sold,
-               Total Price, Retailer Name, Total Income
+    @staticmethod
+    def clear_cache():
+        """Forget memoised sale date bounds, user/category directories and cached reports"""
+        _SALES_BOUNDS_CACHE.clear()
+        _DIRECTORY_CACHE.clear()
+        _REPORT_CACHE.clear()
+
+    @staticmethod
+    def _user_directory():
+        """id -> User (id, full_name, role) for every user, cached for 30 seconds"""
+        users = _DIRECTORY_CACHE.get('users')
+        if users is None:
+            users = {user.id: user for user in User.objects().only('id', 'full_name', 'role')}
+            _DIRECTORY_CACHE.set('users', users)
+        return users
+
+    @staticmethod
+    def _category_directory():
+        """Every category (id, name), cached for 30 seconds"""
+        categories = _DIRECTORY_CACHE.get('categories')
+        if categories is None:
+            categories = list(Category.objects().only('id', 'name'))
+            _DIRECTORY_CACHE.set('categories', categories)
+        return categories
+
+    @staticmethod
+    def _raw_sales(sales):
         """
-        sales = Sale.objects()
+        Stream a filtered Sale queryset newest first as plain dicts ('_id',
+        'created_at', 'retailer_id', 'items'), skipping Document construction.
+        """
+        return (
+            sales.only(*ReportGenerator._SALE_ROW_FIELDS)
+            .order_by('-created_at')
+            .as_pymongo()
+            .batch_size(ReportGenerator._CURSOR_BATCH_SIZE)
+        )
 
-        # If no start_date provided, fetch the first sale date
-        if not start_date:
-            first_sale = sales.order_by('created_at').first()
-            start_date = first_sale.created_at.date() if first_sale else None
+    @staticmethod
+    def _sales_totals(sales):
+        """
+        Summary figures for a filtered Sale queryset, computed in MongoDB.
 
-        # If no end_date provided, fetch the last sale date
-        if not end_date:
-            last_sale = sales.order_by('-created_at').first()
-            end_date = last_sale.created_at.date() if last_sale else None
+        Returns:
+            dict: revenue, units (items sold), lines (line items) and
+                  sales (sales with at least one line item)
+        """
+        pipeline = [
+            {'$project': {
+                'revenue': {'$sum': '$items.line_total'},
+                'units': {'$sum': '$items.quantity'},
+                'lines': {'$size': {'$ifNull': ['$items', []]}}
+            }},
+            {'$match': {'lines': {'$gt': 0}}},
+            {'$group': {
+                '_id': None,
+                'revenue': {'$sum': '$revenue'},
+                'units': {'$sum': '$units'},
+                'lines': {'$sum': '$lines'},
+                'sales': {'$sum': 1}
+            }}
+        ]
+        row = next(iter(sales.aggregate(pipeline)), None) or {}
+        return {
+            'revenue': float(row.get('revenue') or 0),
+            'units': int(row.get('units') or 0),
+            'lines': int(row.get('lines') or 0),
+            'sales': int(row.get('sales') or 0)
+        }
+
+    @staticmethod
+    def _users_by_id(user_ids):
+        """
+        id -> User (id, full_name, role) for the given ids, served from the
+        cached directory; ids it does not know yet are fetched in one $in query.
+        """
+        directory = ReportGenerator._user_directory()
+        found = {uid: directory[uid] for uid in user_ids if uid in directory}
+        missing = [uid for uid in user_ids if uid is not None and uid not in directory]
+        if missing:
+            for user in User.objects(id__in=missing).only('id', 'full_name', 'role'):
+                found[user.id] = user
+        return found
+
+    @staticmethod
+    def _users_by_id_for_roles(roles):
+        """id -> User (id, full_name, role) for every user holding one of `roles`"""
+        return {
+            uid: user for uid, user in ReportGenerator._user_directory().items()
+            if user.role in roles
+        }
+
+    @staticmethod
+    def _user_ids_with_picture(user_ids):
+        """
+        Ids among `user_ids` that have a profile picture. Only _id is projected,
+        so image blobs never leave the database.
+        """
+        if not user_ids:
+            return set()
+        return set(User.objects(id__in=list(user_ids), user_image__ne=None).scalar('id'))
+
+    @staticmethod
+    def _products_by_id(product_ids, *fields):
+        """Fetch the given products in one $in query: id -> Product (only `fields` loaded)"""
+        if not product_ids:
+            return {}
+        products = Product.objects(id__in=list(product_ids)).only('id', *fields)
+        return {product.id: product for product in products}
+
+    @staticmethod
+    def _stock_levels_by_product():
+        """
+        Total batch quantity per product id, computed by one aggregation.
+        Same figure as Product.stock_level, without a query per product.
+        """
+        pipeline = [{'$group': {'_id': '$product_id', 'stock': {'$sum': '$quantity'}}}]
+        return {row['_id']: int(row['stock'] or 0) for row in StockBatch.objects.aggregate(pipeline)}
+
+    @staticmethod
+    def _apply_limit(rows, limit):
+        """Return at most `limit` rows (all rows when limit is None)"""
+        return rows[:limit] if limit else rows
+
+    @staticmethod
+    def _chunks(iterable, size):
+        """Yield lists of up to `size` consecutive items from `iterable`"""
+        iterator = iter(iterable)
+        while True:
+            chunk = list(islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _sales_in_range(start_date=None, end_date=None):
+        """
+        Resolve the date range for the sales reports and filter sales to it.
+        Missing bounds default to the first/last sale date.
+
+        Returns:
+            tuple: (start_date, end_date, Sale queryset)
+        """
+        sales = Sale.objects()
+
+        if not start_date or not end_date:
+            first_date, last_date = ReportGenerator._sales_date_bounds()
+            start_date = start_date or first_date
+            end_date = end_date or last_date
 
         if start_date:
             sales = sales.filter(created_at__gte=ReportGenerator._date_to_start_datetime(start_date))
         if end_date:
             sales = sales.filter(created_at__lte=ReportGenerator._date_to_end_datetime(end_date))
 
-        sales = sales.order_by('-created_at')
+        return start_date, end_date, sales
 
-        results = []
-        for sale in sales:
-            retailer = User.objects(id=sale.retailer_id).first()
+    @staticmethod
+    def _date_range(start_date, end_date):
+        return {
+            'start': start_date.isoformat() if start_date else None,
+            'end': end_date.isoformat() if end_date else None
+        }
 
-            for item in (sale.items or []):
-                product = Product.objects(id=item.product_id).first()
+    @staticmethod
+    def _sales_performance_summary(totals):
+        return {
+            'total_income': round(totals['revenue'], 2),
+            'total_quantity_sold': totals['units'],
+            'total_transactions': totals['sales'],
+            'total_lines': totals['lines']
+        }
 
-                qty = int(item.quantity or 0)
-                line_total = float(item.line_total or 0)
+    @staticmethod
+    def _transaction_summary(totals):
+        return {
+            'total_transactions': totals['lines'],
+            'total_sales_count': totals['sales'],
+            'total_revenue': round(totals['revenue'], 2),
+            'total_items_sold': totals['units']
+        }
 
-                results.append({
-                    'sale_id': sale.id,
-                    'date': sale.created_at.isoformat(),
+    @staticmethod
+    def _sales_performance_rows(sales, chunk_size=None):
+        """
+        Yield Report 1 detail rows for a filtered Sale queryset, newest first.
+        Names are resolved per chunk of rows, one query per collection.
+        """
+        def lines():
+            for sale in ReportGenerator._raw_sales(sales):
+                items = sale.get('items')
+                if not items:
+                    continue
+                sale_date = sale['created_at'].isoformat()  # once per sale
+                for item in items:
+                    yield sale, sale_date, item
+
+        for chunk in ReportGenerator._chunks(lines(), chunk_size or ReportGenerator._CURSOR_BATCH_SIZE):
+            retailers = ReportGenerator._users_by_id({sale.get('retailer_id') for sale, _, _ in chunk})
+            products = ReportGenerator._products_by_id({item.get('product_id') for _, _, item in chunk}, 'name')
+
+            for sale, sale_date, item in chunk:
+                retailer = retailers.get(sale.get('retailer_id'))
+                product = products.get(item.get('product_id'))
+                yield {
+                    'sale_id': sale['_id'],
+                    'date': sale_date,
                     'product_name': product.name if product else 'Unknown',
+                    'quantity_sold': int(item.get('quantity') or 0),
+                    'total_price': float(item.get('line_total') or 0),
+                    'retailer_name': retailer.full_name if retailer else 'Unknown'
+                }
+
+    @staticmethod
+    def _transaction_rows(sales, chunk_size=None):
+        """
+        Yield Report 6 transaction rows for a filtered Sale queryset, newest first.
+        Names are resolved per chunk of rows, one query per collection.
+        """
+        def lines():
+            for sale in ReportGenerator._raw_sales(sales):
+                items = sale.get('items')
+                if not items:
+                    continue
+                transaction_time = sale['created_at'].isoformat(sep=' ', timespec='seconds')  # once per sale
+                for item in items:
+                    yield sale, transaction_time, item
+
+        for chunk in ReportGenerator._chunks(lines(), chunk_size or ReportGenerator._CURSOR_BATCH_SIZE):
+            retailers = ReportGenerator._users_by_id({sale.get('retailer_id') for sale, _, _ in chunk})
+            products = ReportGenerator._products_by_id({item.get('product_id') for _, _, item in chunk}, 'name', 'brand')
+
+            for sale, transaction_time, item in chunk:
+                retailer = retailers.get(sale.get('retailer_id'))
+                product = products.get(item.get('product_id'))
+
+                qty = int(item.get('quantity') or 0)
+                line_total = float(item.get('line_total') or 0)
+                unit_price = (line_total / qty) if qty > 0 else 0.0
+
+                yield {
+                    'sale_id': sale['_id'],
+                    'transaction_time': transaction_time,
+                    'product_id': item.get('product_id'),
+                    'product_name': product.name if product else 'Unknown Product',
+                    'product_brand': product.brand if product else '',
                     'quantity_sold': qty,
-                    'total_price': line_total,
+                    'unit_price': round(unit_price, 2),
+                    'line_total': line_total,
+                    'retailer_id': sale.get('retailer_id'),
                     'retailer_name': retailer.full_name if retailer else 'Unknown'
-                })
+                }
+
+    @staticmethod
+    def _manager_logs(start_date=None, end_date=None):
+        """
+        Product logs written by admins/managers in the range, newest first.
+        Defaults to the last 30 days.
+
+        Returns:
+            tuple: (start_date, end_date, iterator of (raw log, User) pairs)
+        """
+        if not start_date:
+            start_date = date.today() - timedelta(days=30)
+        if not end_date:
+            end_date = date.today()
+
+        # Filter on the manager ids in the query instead of dereferencing
+        # every log's user just to discard non-managers
+        managers = ReportGenerator._users_by_id_for_roles(['admin', 'manager'])
+
+        # Raw documents: ProductLog.user (a ReferenceField) comes back as the user id
+        logs = ProductLog.objects(
+            log_time__gte=ReportGenerator._date_to_start_datetime(start_date),
+            log_time__lte=ReportGenerator._date_to_end_datetime(end_date),
+            user__in=list(managers)
+        ).only(
+            'id', 'user', 'product_id', 'action_type', 'log_time', 'notes'
+        ).order_by('-log_time').as_pymongo().batch_size(ReportGenerator._CURSOR_BATCH_SIZE)
+
+        pairs = ((log, managers.get(log.get('user'))) for log in logs)
+        return start_date, end_date, ((log, user) for log, user in pairs if user)
+
+    @staticmethod
+    def _activity_rows(pairs, chunk_size=None):
+        """Yield Report 5 rows for (raw log, User) pairs, resolving product names per chunk"""
+        for chunk in ReportGenerator._chunks(pairs, chunk_size or ReportGenerator._CURSOR_BATCH_SIZE):
+            products = ReportGenerator._products_by_id({log.get('product_id') for log, _ in chunk}, 'name')
+
+            for log, user in chunk:
+                product = products.get(log.get('product_id'))
+                yield {
+                    'log_id': log['_id'],
+                    'product_name': product.name if product else 'Unknown',
+                    'action_performed': log.get('action_type'),
+                    'manager_id': user.id,
+                    'manager_name': user.full_name,
+                    'date_time': log['log_time'].isoformat(),
+                    'notes': log.get('notes')
+                }
+
+    # ------------------------------------------------------------
+    # REPORT 1
+    # ------------------------------------------------------------
+    @staticmethod
+    def sales_performance_report(start_date=None, end_date=None, limit=None):
+        """
+        Report 1: Sales Performance Report for a Selected Date Range
+
+        Shows: Report ID, Date Range, Product Name, Quantity Sold,
+               Total Price, Retailer Name, Total Income
+
+        Summary totals always cover the whole range; `limit` only bounds the
+        number of detail rows that are resolved and returned.
+        """
+        start_date, end_date, sales = ReportGenerator._sales_in_range(start_date, end_date)
+        totals = ReportGenerator._sales_totals(sales)
 
-        total_income = sum(float(r.get('total_price') or 0) for r in results)
-        total_quantity = sum(int(r.get('quantity_sold') or 0) for r in results)
-        unique_sales = len(set(r['sale_id'] for r in results))
+        # Detail rows stop being read from the cursor once `limit` are collected
+        results = list(islice(ReportGenerator._sales_performance_rows(sales, limit), limit))
 
         return {
             'report_id': 1,
             'report_name': 'Sales Performance Report',
-            'date_range': {
-                'start': start_date.isoformat() if start_date else None,
-                'end': end_date.isoformat() if end_date else None
-            },
+            'date_range': ReportGenerator._date_range(start_date, end_date),
             'sales': results,
-            'summary': {
-                'total_income': round(total_income, 2),
-                'total_quantity_sold': total_quantity,
-                'total_transactions': unique_sales
-            }
+            'summary': ReportGenerator._sales_performance_summary(totals)
         }
 
     # ------------------------------------------------------------
     # REPORT 2
     # ------------------------------------------------------------
     @staticmethod
-    def category_distribution_report():
+    def category_distribution_report(limit=None):
         """
         Report 2: Category Distribution Report
 
         Shows: Category Name, Number of Products,
                Total Stock Quantity, Percentage Share
-        """
-        categories = list(Category.objects())
 
-        all_products = list(Product.objects())
-        total_stock = sum(int(p.stock_level or 0) for p in all_products)
+        Cached for a minute; product, batch and category writes invalidate it.
+        """
+        cache_key = ('category_distribution', limit)
+        report = _REPORT_CACHE.get(cache_key)
+        if report is not None:
+            return report
+
+        categories = ReportGenerator._category_directory()
+
+        # One round-trip: join each product to its batches and group by category,
+        # giving category_id -> (product count, stock) without loading products
+        pipeline = [
+            {'$lookup': {
+                'from': StockBatch._get_collection_name(),
+                'localField': '_id',
+                'foreignField': 'product_id',
+                'as': 'batches'
+            }},
+            {'$group': {
+                '_id': '$category_id',
+                'products': {'$sum': 1},
+                'stock': {'$sum': {'$sum': '$batches.quantity'}}
+            }}
+        ]
+        buckets = {
+            row['_id'] or None: (row['products'], int(row['stock'] or 0))
+            for row in Product.objects.aggregate(pipeline)
+        }
+        total_stock = sum(stock for _, stock in buckets.values())
 
         category_data = []
-        categorized_product_ids = set()
 
         for category in categories:
-            products = list(Product.objects(category_id=category.id))
-            for p in products:
-                categorized_product_ids.add(p.id)
-
-            products_count = len(products)
-            category_stock = sum(int(p.stock_level or 0) for p in products)
+            products_count, category_stock = buckets.get(category.id, (0, 0))
             percentage = (category_stock / total_stock * 100) if total_stock > 0 else 0
 
             category_data.append({
@@ -132,46 +461,65 @@ class ReportGenerator:
             })
 
         # Optional but useful: include uncategorized bucket
-        uncategorized_products = [p for p in all_products if not p.category_id]
-        if uncategorized_products:
-            uncategorized_stock = sum(int(p.stock_level or 0) for p in uncategorized_products)
+        if None in buckets:
+            uncategorized_count, uncategorized_stock = buckets[None]
             percentage = (uncategorized_stock / total_stock * 100) if total_stock > 0 else 0
 
             category_data.append({
                 'category_id': None,
                 'category_name': 'Uncategorized',
-                'number_of_products': len(uncategorized_products),
+                'number_of_products': uncategorized_count,
                 'total_stock_quantity': uncategorized_stock,
                 'percentage_share': round(percentage, 2)
             })
 
-        return {
+        report = {
             'report_id': 2,
             'report_name': 'Category Distribution Report',
-            'categories': category_data,
+            'categories': ReportGenerator._apply_limit(category_data, limit),
             'summary': {
                 'total_categories': len(categories),
                 'total_stock': total_stock
             }
         }
+        _REPORT_CACHE.set(cache_key, report)
+        return report
 
     # ------------------------------------------------------------
     # REPORT 3
     # ------------------------------------------------------------
     @staticmethod
-    def retailer_performance_report():
+    def retailer_performance_report(limit=None):
         """
         Report 3: Retailer Performance Report
 
         Shows: Retailer Name, User ID, Daily Quota Target,
                Current Sales, Streak Count
         """
-        retailers = list(User.objects(role__in=['retailer', 'staff']))
+        retailers = list(
+            User.objects(role__in=['retailer', 'staff']).only('id', 'full_name')
+        )
+        pending = {r.id: r for r in retailers}
+        with_picture = ReportGenerator._user_ids_with_picture(pending)
+
+        # Metrics come back already ranked by streak, then total sales (ties by
+        # retailer id); references stay undereferenced since only the id is needed
+        ranked = []
+        with no_dereference(RetailerMetrics):
+            metrics_qs = RetailerMetrics.objects(retailer__in=list(pending)).only(
+                'retailer', 'daily_quota', 'sales_today', 'current_streak', 'total_sales'
+            ).order_by('-current_streak', '-total_sales', 'retailer')
+            for metrics in metrics_qs:
+                retailer = pending.pop(metrics.retailer.id, None)
+                if retailer:
+                    ranked.append((retailer, metrics))
+
+        # Retailers without metrics rank last (zero streak and sales)
+        ranked.extend((retailer, None) for retailer in pending.values())
 
         performance_data = []
-        for retailer in retailers:
-            metrics = RetailerMetrics.objects(retailer=retailer).first()
-
+        active_today = 0
+        for retailer, metrics in ranked:
             if not metrics:
                 # Provide safe defaults so the report is complete
                 metrics_data = {
@@ -191,6 +539,8 @@ class ReportGenerator:
             daily_quota = metrics_data['daily_quota']
             sales_today = metrics_data['sales_today']
             quota_progress = (sales_today / daily_quota * 100) if daily_quota > 0 else 0
+            if sales_today > 0:
+                active_today += 1
 
             performance_data.append({
                 'retailer_name': retailer.full_name,
@@ -200,18 +550,17 @@ class ReportGenerator:
                 'quota_progress': round(quota_progress, 2),
                 'streak_count': metrics_data['current_streak'],
                 'total_sales': metrics_data['total_sales'],
-                'has_profile_pic': retailer.user_image is not None
+                'has_profile_pic': retailer.id in with_picture
             })
 
-        performance_data.sort(key=lambda x: (x['streak_count'], x['total_sales']), reverse=True)
 
         return {
             'report_id': 3,
             'report_name': 'Retailer Performance Report',
-            'retailers': performance_data,
+            'retailers': ReportGenerator._apply_limit(performance_data, limit),
             'summary': {
                 'total_retailers': len(retailers),
-                'active_today': len([r for r in performance_data if (r.get('current_sales') or 0) > 0])
+                'active_today': active_today
             }
         }
 
@@ -219,54 +568,90 @@ class ReportGenerator:
     # REPORT 4
     # ------------------------------------------------------------
     @staticmethod
-    def low_stock_and_expiration_alert_report(days_ahead=7):
+    def low_stock_and_expiration_alert_report(days_ahead=7, limit=None):
         """
         Report 4: Low-Stock and Expiration Alert Report
-        """
-        products = Product.objects()
-        alerts = []
 
+        CRITICAL (out-of-stock) alerts are listed before warnings, so a
+        `limit` never drops one in favour of a warning.
+        """
         cutoff_date = date.today() + timedelta(days=int(days_ahead or 7))
 
+        stock_levels = ReportGenerator._stock_levels_by_product()
+
+        # Earliest expiry among non-empty batches expiring by the cutoff, per product
+        pipeline = [
+            {'$match': {
+                'expiration_date': {'$ne': None, '$lte': ReportGenerator._date_to_start_datetime(cutoff_date)},
+                'quantity': {'$gt': 0}
+            }},
+            {'$group': {'_id': '$product_id', 'earliest': {'$min': '$expiration_date'}}}
+        ]
+        expiry_by_product = {
+            row['_id']: row['earliest'].date()
+            for row in StockBatch.objects.aggregate(pipeline)
+        }
+
+        # Only id and threshold are needed to decide whether a product alerts;
+        # names are fetched afterwards for the alerts actually returned
+        products = Product.objects().only('id', 'min_stock_level').as_pymongo()
+        default_min_stock = Product.min_stock_level.default
+
+        # (product id, min stock level, stock, expiry, statuses); critical alerts
+        # are kept apart so they are listed, and survive `limit`, first
+        critical = []
+        warning = []
+        total_alerts = 0
+        critical_alerts = 0
         for product in products:
-            stock = int(product.stock_level or 0)
+            product_id = product['_id']
+            min_stock_level = product.get('min_stock_level', default_min_stock)
+            stock = stock_levels.get(product_id, 0)
             alert_status = []
 
-            if stock < int(product.min_stock_level or 0):
+            if stock < int(min_stock_level or 0):
                 alert_status.append("OUT_OF_STOCK" if stock == 0 else "LOW_STOCK")
 
-            expiring_batches = StockBatch.objects(
-                product_id=product.id,
-                expiration_date__lte=cutoff_date,
-                expiration_date__ne=None,
-                quantity__gt=0
-            )
-
-            if expiring_batches.count() > 0:
+            earliest_expiry = expiry_by_product.get(product_id)
+            if earliest_expiry:
                 alert_status.append("EXPIRING_SOON")
-                earliest_expiry = min(batch.expiration_date for batch in expiring_batches)
-            else:
-                earliest_expiry = None
-
-            if alert_status:
-                alerts.append({
-                    'product_id': product.id,
-                    'product_name': product.name,
-                    'current_stock': stock,
-                    'min_stock_level': product.min_stock_level,
-                    'expiration_date': earliest_expiry.isoformat() if earliest_expiry else None,
-                    'alert_status': ', '.join(alert_status),
-                    'severity': 'CRITICAL' if 'OUT_OF_STOCK' in alert_status else 'WARNING'
-                })
+
+            if not alert_status:
+                continue
+
+            total_alerts += 1
+            bucket = critical if 'OUT_OF_STOCK' in alert_status else warning
+            critical_alerts += bucket is critical
+            if not limit or len(bucket) < limit:
+                bucket.append((product_id, min_stock_level, stock, earliest_expiry, alert_status))
+
+        candidates = critical + warning
+        if limit:
+            candidates = candidates[:limit]
+
+        names = ReportGenerator._products_by_id({c[0] for c in candidates}, 'name')
+
+        alerts = []
+        for product_id, min_stock_level, stock, earliest_expiry, alert_status in candidates:
+            product = names.get(product_id)
+            alerts.append({
+                'product_id': product_id,
+                'product_name': product.name if product else None,
+                'current_stock': stock,
+                'min_stock_level': min_stock_level,
+                'expiration_date': earliest_expiry.isoformat() if earliest_expiry else None,
+                'alert_status': ', '.join(alert_status),
+                'severity': 'CRITICAL' if 'OUT_OF_STOCK' in alert_status else 'WARNING'
+            })
 
         return {
             'report_id': 4,
             'report_name': 'Low-Stock and Expiration Alert Report',
             'alerts': alerts,
             'summary': {
-                'total_alerts': len(alerts),
-                'critical_alerts': len([a for a in alerts if a['severity'] == 'CRITICAL']),
-                'warning_alerts': len([a for a in alerts if a['severity'] == 'WARNING'])
+                'total_alerts': total_alerts,
+                'critical_alerts': critical_alerts,
+                'warning_alerts': total_alerts - critical_alerts
             }
         }
 
@@ -274,58 +659,29 @@ class ReportGenerator:
     # REPORT 5
     # ------------------------------------------------------------
     @staticmethod
-    def managerial_activity_log_report(start_date=None, end_date=None):
+    def managerial_activity_log_report(start_date=None, end_date=None, limit=None):
         """
         Report 5: Managerial Activity Log Report
         """
-        if not start_date:
-            start_date = date.today() - timedelta(days=30)
-        if not end_date:
-            end_date = date.today()
-
-        start_datetime = ReportGenerator._date_to_start_datetime(start_date)
-        end_datetime = ReportGenerator._date_to_end_datetime(end_date)
-
-        all_logs = ProductLog.objects(
-            log_time__gte=start_datetime,
-            log_time__lte=end_datetime
-        ).order_by('-log_time')
+        start_date, end_date, pairs = ReportGenerator._manager_logs(start_date, end_date)
 
-        results = []
+        # Summary counts cover every log; only the returned rows get product names
         unique_managers = set()
-
-        for log in all_logs:
-            user = log.user  # ProductLog.user is a ReferenceField(User)
-
-            if not user:
-                continue
-
-            if user.role not in ['admin', 'manager']:
-                continue
-
-            product = Product.objects(id=log.product_id).first()
-
-            results.append({
-                'log_id': log.id,
-                'product_name': product.name if product else 'Unknown',
-                'action_performed': log.action_type,
-                'manager_id': user.id,
-                'manager_name': user.full_name,
-                'date_time': log.log_time.isoformat(),
-                'notes': log.notes
-            })
+        total_actions = 0
+        selected = []  # (log, user) pairs that become detail rows
+        for log, user in pairs:
+            total_actions += 1
             unique_managers.add(user.id)
+            if not limit or len(selected) < limit:
+                selected.append((log, user))
 
         return {
             'report_id': 5,
             'report_name': 'Managerial Activity Log Report',
-            'date_range': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'logs': results,
+            'date_range': ReportGenerator._date_range(start_date, end_date),
+            'logs': list(ReportGenerator._activity_rows(selected, limit)),
             'summary': {
-                'total_actions': len(results),
+                'total_actions': total_actions,
                 'unique_managers': len(unique_managers)
             }
         }
@@ -334,86 +690,55 @@ class ReportGenerator:
     # REPORT 6
     # ------------------------------------------------------------
     @staticmethod
-    def detailed_sales_transaction_report(start_date=None, end_date=None):
+    def detailed_sales_transaction_report(start_date=None, end_date=None, limit=None):
         """
         Report 6: Detailed Sales Transaction Report
-        """
-        sales = Sale.objects()
-
-        # Consistent defaulting with Report 1 (optional but helpful)
-        if not start_date:
-            first_sale = sales.order_by('created_at').first()
-            start_date = first_sale.created_at.date() if first_sale else None
-
-        if not end_date:
-            last_sale = sales.order_by('-created_at').first()
-            end_date = last_sale.created_at.date() if last_sale else None
-
-        if start_date:
-            sales = sales.filter(created_at__gte=ReportGenerator._date_to_start_datetime(start_date))
-        if end_date:
-            sales = sales.filter(created_at__lte=ReportGenerator._date_to_end_datetime(end_date))
-
-        sales = sales.order_by('-created_at')
-
-        transactions = []
-        total_revenue = 0.0
-        total_items = 0
-
-        for sale in sales:
-            retailer = User.objects(id=sale.retailer_id).first()
 
-            for item in (sale.items or []):
-                product = Product.objects(id=item.product_id).first()
-
-                qty = int(item.quantity or 0)
-                line_total = float(item.line_total or 0)
-                unit_price = (line_total / qty) if qty > 0 else 0.0
-
-                transaction_data = {
-                    'sale_id': sale.id,
-                    'transaction_time': sale.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                    'product_id': item.product_id,
-                    'product_name': product.name if product else 'Unknown Product',
-                    'product_brand': product.brand if product else '',
-                    'quantity_sold': qty,
-                    'unit_price': round(unit_price, 2),
-                    'line_total': line_total,
-                    'retailer_id': sale.retailer_id,
-                    'retailer_name': retailer.full_name if retailer else 'Unknown'
-                }
-
-                transactions.append(transaction_data)
-                total_revenue += line_total
-                total_items += qty
+        Summary totals always cover the whole range; `limit` only bounds the
+        number of transaction rows that are resolved and returned.
+        """
+        start_date, end_date, sales = ReportGenerator._sales_in_range(start_date, end_date)
+        totals = ReportGenerator._sales_totals(sales)
 
         return {
             'report_id': 6,
             'report_name': 'Detailed Sales Transaction Report',
-            'date_range': {
-                'start': start_date.isoformat() if start_date else None,
-                'end': end_date.isoformat() if end_date else None
-            },
-            'summary': {
-                'total_transactions': len(transactions),
-                'total_sales_count': len(set(t['sale_id'] for t in transactions)),
-                'total_revenue': round(total_revenue, 2),
-                'total_items_sold': total_items
-            },
-            'transactions': transactions
+            'date_range': ReportGenerator._date_range(start_date, end_date),
+            'summary': ReportGenerator._transaction_summary(totals),
+            # Rows stop being read from the cursor once `limit` are collected
+            'transactions': list(islice(ReportGenerator._transaction_rows(sales, limit), limit))
         }
 
     # ------------------------------------------------------------
     # REPORT 7
     # ------------------------------------------------------------
     @staticmethod
-    def user_accounts_report():
+    def user_accounts_report(limit=None):
         """
         Report 7: User Accounts Report
+
+        Cached for a minute; user writes invalidate it.
         """
-        users = User.objects().order_by('full_name')
+        cache_key = ('user_accounts', limit)
+        report = _REPORT_CACHE.get(cache_key)
+        if report is not None:
+            return report
+
+        # All summary counts from one aggregation: role -> number of users
+        role_counts = {
+            row['_id']: row['n']
+            for row in User.objects.aggregate([{'$group': {'_id': '$role', 'n': {'$sum': 1}}}])
+        }
 
-        return {
+        users = User.objects().only(
+            'id', 'username', 'full_name', 'role', 'email', 'is_active', 'created_at'
+        ).order_by('full_name')
+        if limit:
+            users = users.limit(limit)
+        users = list(users)
+        with_picture = ReportGenerator._user_ids_with_picture([user.id for user in users])
+
+        report = {
             'report_id': 7,
             'report_name': 'User Accounts Report',
             'users': [
@@ -425,14 +750,75 @@ class ReportGenerator:
                     'email': user.email,
                     'account_status': 'Active' if getattr(user, "is_active", True) else 'Inactive',
                     'created_at': user.created_at.isoformat() if getattr(user, "created_at", None) else None,
-                    'has_profile_pic': user.user_image is not None
+                    'has_profile_pic': user.id in with_picture
                 }
                 for user in users
             ],
             'summary': {
-                'total_users': users.count(),
-                'admins': User.objects(role='admin').count(),
-                'managers': User.objects(role='manager').count(),
-                'retailers': User.objects(role__in=['retailer', 'staff']).count()
+                'total_users': sum(role_counts.values()),
+                'admins': role_counts.get('admin', 0),
+                'managers': role_counts.get('manager', 0),
+                'retailers': role_counts.get('retailer', 0) + role_counts.get('staff', 0)
             }
         }
+        _REPORT_CACHE.set(cache_key, report)
+        return report
+
+    # ------------------------------------------------------------
+    # STREAMING (row-by-row variants of reports 1, 5 and 6)
+    # ------------------------------------------------------------
+    # Each yields frames for an NDJSON response: {'header': {...}} first,
+    # then one {'row': {...}} per row, then {'summary': {...}} last.
+    # Rows are produced as the cursor is read, so memory stays flat however
+    # wide the date range is.
+
+    @staticmethod
+    def stream_sales_performance_report(start_date=None, end_date=None):
+        """Report 1 as a stream of header, row and summary frames"""
+        start_date, end_date, sales = ReportGenerator._sales_in_range(start_date, end_date)
+
+        yield {'header': {
+            'report_id': 1,
+            'report_name': 'Sales Performance Report',
+            'date_range': ReportGenerator._date_range(start_date, end_date)
+        }}
+        for row in ReportGenerator._sales_performance_rows(sales):
+            yield {'row': row}
+        yield {'summary': ReportGenerator._sales_performance_summary(ReportGenerator._sales_totals(sales))}
+
+    @staticmethod
+    def stream_managerial_activity_log_report(start_date=None, end_date=None):
+        """Report 5 as a stream of header, row and summary frames"""
+        start_date, end_date, pairs = ReportGenerator._manager_logs(start_date, end_date)
+
+        yield {'header': {
+            'report_id': 5,
+            'report_name': 'Managerial Activity Log Report',
+            'date_range': ReportGenerator._date_range(start_date, end_date)
+        }}
+
+        unique_managers = set()
+        total_actions = 0
+        for row in ReportGenerator._activity_rows(pairs):
+            total_actions += 1
+            unique_managers.add(row['manager_id'])
+            yield {'row': row}
+
+        yield {'summary': {
+            'total_actions': total_actions,
+            'unique_managers': len(unique_managers)
+        }}
+
+    @staticmethod
+    def stream_detailed_sales_transaction_report(start_date=None, end_date=None):
+        """Report 6 as a stream of header, row and summary frames"""
+        start_date, end_date, sales = ReportGenerator._sales_in_range(start_date, end_date)
+
+        yield {'header': {
+            'report_id': 6,
+            'report_name': 'Detailed Sales Transaction Report',
+            'date_range': ReportGenerator._date_range(start_date, end_date)
+        }}
+        for row in ReportGenerator._transaction_rows(sales):
+            yield {'row': row}
+        yield {'summary': ReportGenerator._transaction_summary(ReportGenerator._sales_totals(sales))}
@@ -1,12 +1,39 @@
 # api_server/core/sales_manager.py
 
-from utils.counters import get_next_sequence  # keep if used elsewhere
+from utils.counters import get_next_sequence, get_next_sequence_block
 from models.sale import Sale, SaleItem, SaleBatchDeduction
 from models.product import Product
+from models.stock_batch import StockBatch
+from models.user import User
 from models.retailer_metrics import RetailerMetrics
 from core.inventory_manager import InventoryManager, InventoryError
 from core.activity_logger import ActivityLogger
+from utils.cache import LRUCache
+from utils.rate_limiter import TokenBucket
 from datetime import datetime, date, timedelta, timezone
+from mongoengine import signals, NotUniqueError
+import os
+
+
+# Optional cap on bulk writes per second for this worker process (0 = no cap).
+# With several workers, set it to the database's budget divided by their count.
+_BULK_WRITE_RATE = float(os.getenv('BULK_WRITE_RATE', 0))
+_BULK_WRITE_LIMITER = TokenBucket(_BULK_WRITE_RATE) if _BULK_WRITE_RATE > 0 else None
+
+# id -> display name for the retailers and products shown in sales listings
+_USER_NAME_CACHE = LRUCache(maxsize=1024, ttl=60)
+_PRODUCT_NAME_CACHE = LRUCache(maxsize=1024, ttl=60)
+
+
+def _forget_cached_name(sender, document, **kwargs):
+    """A saved or deleted user/product drops its cached name"""
+    cache = _USER_NAME_CACHE if sender is User else _PRODUCT_NAME_CACHE
+    cache.pop(document.id)
+
+
+for _model in (User, Product):
+    signals.post_save.connect(_forget_cached_name, sender=_model)
+    signals.post_delete.connect(_forget_cached_name, sender=_model)
 
 
 class SalesError(Exception):
@@ -38,6 +65,9 @@ class SalesManager:
             if total_amount is None:
                 raise SalesError("total_amount is required")
 
+            rid = int(retailer_id)
+            amount = float(total_amount)
+
             # Normalize items (prevents string qty/product_id errors)
             normalized_items = []
             for item in items:
@@ -63,41 +93,84 @@ class SalesManager:
                     "line_total": line_total
                 })
 
+            # Fetch every product in the sale once; reused for validation and logging
+            products = {
+                p.id: p
+                for p in Product.objects(
+                    id__in=list({item["product_id"] for item in normalized_items})
+                ).only('id', 'name')
+            }
+
+            # Unknown products are rejected before any stock is checked
+            missing = [item["product_id"] for item in normalized_items if item["product_id"] not in products]
+            if missing:
+                raise SalesError(f"Product ID {missing[0]} not found")
+
             # Phase 1: Validate all items first (prevents partial deductions)
             for item in normalized_items:
-                product = Product.objects(id=int(item["product_id"])).first()
-                if not product:
-                    raise SalesError(f"Product ID {item['product_id']} not found")
+                InventoryManager.validate_stock(item["product_id"], item["quantity"])
+
+            # Phase 2: Deduct stock using FEFO + track exactly which batches were used.
+            # Different products touch different batches, so they deduct in parallel;
+            # lines for the same product stay in order within one worker.
+            lines_by_product = {}  # product_id -> indexes into normalized_items
+            for index, item in enumerate(normalized_items):
+                lines_by_product.setdefault(item["product_id"], []).append(index)
+
+            batch_tracking = {}  # item index -> list of {"batch_id": int, "quantity": int}
+
+            def deduct_lines(indexes):
+                # Each batch is recorded as soon as it is saved, so a failure
+                # (even part-way through a line) still knows what to put back
+                for index in indexes:
+                    batch_tracking[index] = []
+                    InventoryManager.deduct_stock_fefo(
+                        product_id=normalized_items[index]["product_id"],
+                        qty_needed=normalized_items[index]["quantity"],
+                        user_id=rid,
+                        reason="Sale",
+                        deductions=batch_tracking[index]
+                    )
 
-                InventoryManager.validate_stock(int(item["product_id"]), int(item["quantity"]))
+            groups = list(lines_by_product.values())
+            try:
+                if len(groups) == 1:
+                    deduct_lines(groups[0])
+                else:
+                    from concurrent.futures import ThreadPoolExecutor, wait
 
-            # Phase 2: Deduct stock using FEFO + track exactly which batches were used
-            batch_tracking = {}  # product_id -> list of {"batch_id": int, "quantity": int}
-            for item in normalized_items:
-                deductions = InventoryManager.deduct_stock_fefo(
-                    product_id=int(item["product_id"]),
-                    qty_needed=int(item["quantity"]),
-                    user_id=int(retailer_id),
-                    reason="Sale"
-                )
-                batch_tracking[int(item["product_id"])] = deductions or []
+                    with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+                        futures = [executor.submit(deduct_lines, group) for group in groups]
+                        wait(futures)
+                    for future in futures:
+                        future.result()  # re-raises the first worker failure
+            except Exception:
+                # No multi-document transaction here (needs a replica set):
+                # compensate by restoring every deduction that went through
+                SalesManager._restore_batches([
+                    SaleBatchDeduction(batch_id=int(d["batch_id"]), quantity=int(d.get("quantity", 0)))
+                    for deductions in batch_tracking.values()
+                    for d in deductions
+                    if d and d.get("batch_id") is not None
+                ])
+                raise
 
             # Phase 3: Create sale record
             sale = Sale(
-                retailer_id=int(retailer_id),
-                total_amount=float(total_amount),
+                retailer_id=rid,
+                total_amount=amount,
                 created_at=datetime.now(timezone.utc)
             )
 
             # Phase 4: Create sale items + persist batch provenance
-            for item in normalized_items:
-                pid = int(item["product_id"])
-                deductions = batch_tracking.get(pid, []) or []
+            for index, item in enumerate(normalized_items):
+                pid = item["product_id"]
+                deductions = batch_tracking.get(index, [])
 
                 sale_item = SaleItem(
                     product_id=pid,
-                    quantity=int(item["quantity"]),
-                    line_total=float(item["line_total"]),
+                    quantity=item["quantity"],
+                    line_total=item["line_total"],
                     batch_deductions=[
                         SaleBatchDeduction(
                             batch_id=int(d.get("batch_id")),
@@ -111,31 +184,39 @@ class SalesManager:
 
             # Phase 5: Save sale and update retailer metrics
             sale.save()
-            SalesManager._update_retailer_metrics(int(retailer_id), float(total_amount))
+            SalesManager._update_retailer_metrics(rid, amount)
+
+            # A new sale can move the default report date range
+            from core.report_generator import ReportGenerator
+            ReportGenerator.clear_cache()
 
             # Phase 6: Log transaction (single place)
             product_names = []
             for item in normalized_items:
-                product = Product.objects(id=int(item["product_id"])).first()
+                product = products.get(item["product_id"])
                 if product:
                     product_names.append(product.name)
 
-                ActivityLogger.log_product_action(
-                    product_id=int(item["product_id"]),
-                    user_id=int(retailer_id),
-                    action_type="Sale",
-                    quantity=int(item["quantity"]),
-                    notes=f"Sold via sale #{sale.id}"
-                )
+            SalesManager._throttle_bulk_write()
+            ActivityLogger.log_product_actions(
+                {
+                    "product_id": item["product_id"],
+                    "user_id": rid,
+                    "action_type": "Sale",
+                    "quantity": item["quantity"],
+                    "notes": f"Sold via sale #{sale.id}"
+                }
+                for item in normalized_items
+            )
 
             ActivityLogger.log_api_activity(
                 method="POST",
                 target_entity="sale",
-                user_id=int(retailer_id),
+                user_id=rid,
                 details=(
                     f"Sale ID {sale.id}: {len(normalized_items)} items "
                     f"({', '.join(product_names) if product_names else 'Unknown products'}), "
-                    f"total ${float(total_amount):.2f}"
+                    f"total ${amount:.2f}"
                 )
             )
 
@@ -152,47 +233,155 @@ class SalesManager:
         Update retailer performance metrics after a sale.
         Handles streaks, quotas, and totals.
         """
-        from models.user import User
+        amount = float(sale_amount)
+        today = date.today()
 
-        user = User.objects(id=int(retailer_id)).first()
+        # DateField values are stored as midnight datetimes
+        today_start = datetime.combine(today, datetime.min.time())
+        yesterday_start = today_start - timedelta(days=1)
+        new_day = {'$lt': [{'$ifNull': ['$last_sale_date', today_start]}, today_start]}
+
+        # Whole update runs server-side in one atomic call; within a stage,
+        # field references read the values from before that stage
+        pipeline = [
+            # Reset daily sales if it's a new day; the streak only carries on
+            # when yesterday's quota was met
+            {'$set': {
+                'current_streak': {'$cond': [
+                    new_day,
+                    {'$cond': [
+                        {'$and': [
+                            {'$eq': ['$last_sale_date', yesterday_start]},
+                            {'$gte': ['$sales_today', '$daily_quota']}
+                        ]},
+                        {'$add': ['$current_streak', 1]},
+                        0
+                    ]},
+                    '$current_streak'
+                ]},
+                'sales_today': {'$cond': [new_day, 0.0, '$sales_today']}
+            }},
+            {'$set': {
+                'sales_today': {'$add': ['$sales_today', amount]},
+                'total_sales': {'$add': ['$total_sales', amount]},
+                'total_transactions': {'$add': ['$total_transactions', 1]},
+                'last_sale_date': today_start
+            }},
+            # Start streak if quota met today
+            {'$set': {
+                'current_streak': {'$cond': [
+                    {'$and': [
+                        {'$eq': ['$current_streak', 0]},
+                        {'$gte': ['$sales_today', '$daily_quota']}
+                    ]},
+                    1,
+                    '$current_streak'
+                ]}
+            }}
+        ]
+
+        if RetailerMetrics.objects(retailer=int(retailer_id)).update_one(__raw__=pipeline):
+            return
+
+        # First sale for this retailer: create its metrics (ids come from the
+        # counter sequence, so this cannot be an upsert)
+        user = User.objects(id=int(retailer_id)).only('id').first()
         if not user:
             return
 
-        metrics = RetailerMetrics.objects(retailer=user).first()
+        metrics = RetailerMetrics(
+            retailer=user,
+            daily_quota=1000.0,
+            sales_today=amount,
+            total_sales=amount,
+            total_transactions=1,
+            current_streak=1 if amount >= 1000.0 else 0,
+            last_sale_date=today
+        )
+        try:
+            metrics.save()
+        except NotUniqueError:
+            # A concurrent sale created them first; apply this one on top
+            RetailerMetrics.objects(retailer=user.id).update_one(__raw__=pipeline)
 
-        if not metrics:
-            metrics = RetailerMetrics(
-                retailer=user,
-                daily_quota=1000.0,
-                sales_today=0.0,
-                total_sales=0.0,
-                total_transactions=0,
-                current_streak=0
-            )
+    @staticmethod
+    def _cached_names(model, field, cache, ids):
+        """
+        id -> `field` for the given ids, served from `cache` where possible;
+        the misses are loaded with one $in query and cached.
+        """
+        names, missing = {}, []
+        for doc_id in set(ids):
+            name = cache.get(doc_id)
+            if name is None:
+                missing.append(doc_id)
+            else:
+                names[doc_id] = name
 
-        today = date.today()
+        if missing:
+            for doc in model.objects(id__in=missing).only('id', field):
+                name = getattr(doc, field)
+                names[doc.id] = name
+                cache.set(doc.id, name)
+        return names
 
-        # Reset daily sales if it's a new day
-        if metrics.last_sale_date and metrics.last_sale_date < today:
-            yesterday = today - timedelta(days=1)
+    @staticmethod
+    def _user_names(user_ids):
+        """id -> full name for the given users"""
+        return SalesManager._cached_names(User, 'full_name', _USER_NAME_CACHE, user_ids)
 
-            if metrics.last_sale_date == yesterday and metrics.sales_today >= metrics.daily_quota:
-                metrics.current_streak += 1
-            else:
-                metrics.current_streak = 0
+    @staticmethod
+    def _product_names(product_ids):
+        """id -> name for the given products"""
+        return SalesManager._cached_names(Product, 'name', _PRODUCT_NAME_CACHE, product_ids)
 
-            metrics.sales_today = 0.0
+    @staticmethod
+    def _throttle_bulk_write():
+        """Wait for the bulk-write limiter, when BULK_WRITE_RATE configures one."""
+        if _BULK_WRITE_LIMITER is not None:
+            _BULK_WRITE_LIMITER.acquire()
 
-        metrics.sales_today += float(sale_amount)
-        metrics.total_sales += float(sale_amount)
-        metrics.total_transactions += 1
-        metrics.last_sale_date = today
+    @staticmethod
+    def _floored_subtract(field, amount):
+        """Update-pipeline expression for max(0, field - amount), treating a missing field as 0."""
+        return {'$max': [0, {'$subtract': [{'$ifNull': [f'${field}', 0]}, amount]}]}
+
+    @staticmethod
+    def _restore_batches(deductions):
+        """
+        Add deducted quantities back to their original batches.
 
-        # Start streak if quota met today
-        if metrics.sales_today >= metrics.daily_quota and metrics.current_streak == 0:
-            metrics.current_streak = 1
+        All batches are checked first (one query), so a missing batch
+        restores nothing; the increments then go out as one bulk write.
 
-        metrics.save()
+        Args:
+            deductions (list): SaleBatchDeduction entries to restore
+
+        Raises:
+            SalesError: If an original batch no longer exists
+        """
+        from pymongo import UpdateOne
+        restore = {}  # batch_id -> quantity to add back
+        for d in deductions:
+            batch_id = int(d.batch_id)
+            restore[batch_id] = restore.get(batch_id, 0) + int(d.quantity or 0)
+        if not restore:
+            return
+
+        found = set(StockBatch.objects(id__in=list(restore)).scalar('id'))
+        for batch_id in restore:
+            if batch_id not in found:
+                raise SalesError(f"Original batch {batch_id} not found")
+
+        SalesManager._throttle_bulk_write()
+        StockBatch._get_collection().bulk_write(
+            [UpdateOne({'_id': batch_id}, {'$inc': {'quantity': qty}}) for batch_id, qty in restore.items()],
+            ordered=False
+        )
+
+        # Bulk writes skip document signals, so drop cached stock reports here
+        from core.report_generator import ReportGenerator
+        ReportGenerator.clear_cache()
 
     @staticmethod
     def undo_sale(sale_id, user_id):
@@ -206,60 +395,76 @@ class SalesManager:
             raise SalesError(f"Sale ID {sale_id} not found")
 
         try:
-            from models.stock_batch import StockBatch
-            from models.user import User
+            # Restore stock for every tracked item back to its original batches
+            SalesManager._restore_batches(
+                [d for item in (sale.items or []) for d in (item.batch_deductions or [])]
+            )
 
-            # Restore stock for each item back to original batches
+            # Legacy items (old data without deductions) come back as new batches,
+            # numbered from one reserved id block and inserted together
+            legacy_count = sum(1 for item in (sale.items or []) if not item.batch_deductions)
+            if legacy_count:
+                undo_user = User.objects(id=int(user_id)).only('id', 'full_name').first()
+                next_batch_id = get_next_sequence_block(StockBatch.__name__.lower(), legacy_count)
+            now = datetime.now(timezone.utc)  # shared by every legacy batch of this undo
+
+            log_entries = []
+            legacy_batches = []
             for item in (sale.items or []):
                 deductions = list(item.batch_deductions or [])
 
                 # Legacy fallback: if no deductions exist (old data), create a batch like before
                 if not deductions:
-                    undo_user = User.objects(id=int(user_id)).first()
                     legacy_batch = StockBatch(
+                        id=next_batch_id,
                         product_id=int(item.product_id),
                         quantity=int(item.quantity),
                         expiration_date=None,
-                        added_at=datetime.now(timezone.utc),
+                        added_at=now,
                         added_by=undo_user,
                         reason="Sale reversal (legacy)"
                     )
-                    legacy_batch.save()
-
-                    ActivityLogger.log_product_action(
-                        product_id=int(item.product_id),
-                        user_id=int(user_id),
-                        action_type="Sale Reversal",
-                        quantity=int(item.quantity),
-                        notes=f"Legacy restore via undo of sale #{sale.id} (new batch {legacy_batch.id})"
-                    )
+                    legacy_batches.append(legacy_batch)
+                    next_batch_id += 1
+
+                    log_entries.append({
+                        "product_id": int(item.product_id),
+                        "user_id": int(user_id),
+                        "action_type": "Sale Reversal",
+                        "quantity": int(item.quantity),
+                        "notes": f"Legacy restore via undo of sale #{sale.id} (new batch {legacy_batch.id})"
+                    })
                     continue
 
                 for d in deductions:
-                    batch = StockBatch.objects(id=int(d.batch_id)).first()
-                    if not batch:
-                        raise SalesError(f"Original batch {d.batch_id} not found")
-
-                    batch.quantity = int(batch.quantity or 0) + int(d.quantity or 0)
-                    batch.save()
-
-                    ActivityLogger.log_product_action(
-                        product_id=int(item.product_id),
-                        user_id=int(user_id),
-                        action_type="Sale Reversal",
-                        quantity=int(d.quantity or 0),
-                        notes=f"Restored to batch {batch.id} via undo of sale #{sale.id}"
-                    )
-
-            # Adjust retailer metrics
-            retailer_user = User.objects(id=int(sale.retailer_id)).first()
-            metrics = RetailerMetrics.objects(retailer=retailer_user).first() if retailer_user else None
-
-            if metrics:
-                metrics.sales_today = max(0.0, float(metrics.sales_today or 0) - float(sale.total_amount or 0))
-                metrics.total_sales = max(0.0, float(metrics.total_sales or 0) - float(sale.total_amount or 0))
-                metrics.total_transactions = max(0, int(metrics.total_transactions or 0) - 1)
-                metrics.save()
+                    log_entries.append({
+                        "product_id": int(item.product_id),
+                        "user_id": int(user_id),
+                        "action_type": "Sale Reversal",
+                        "quantity": int(d.quantity or 0),
+                        "notes": f"Restored to batch {int(d.batch_id)} via undo of sale #{sale.id}"
+                    })
+
+            if legacy_batches:
+                SalesManager._throttle_bulk_write()
+                StockBatch.objects.insert(legacy_batches, load_bulk=False)
+
+                # Bulk inserts skip document signals, so drop cached stock reports here
+                from core.report_generator import ReportGenerator
+                ReportGenerator.clear_cache()
+
+            SalesManager._throttle_bulk_write()
+            ActivityLogger.log_product_actions(log_entries)
+
+            # Adjust retailer metrics in one atomic update
+            amount = float(sale.total_amount or 0)
+            RetailerMetrics.objects(retailer=int(sale.retailer_id)).update_one(__raw__=[
+                {'$set': {
+                    'sales_today': SalesManager._floored_subtract('sales_today', amount),
+                    'total_sales': SalesManager._floored_subtract('total_sales', amount),
+                    'total_transactions': SalesManager._floored_subtract('total_transactions', 1)
+                }}
+            ])
 
             ActivityLogger.log_api_activity(
                 method="DELETE",
@@ -297,10 +502,7 @@ class SalesManager:
             raise SalesError("Invalid item index")
 
         try:
-            from models.stock_batch import StockBatch
-            from models.user import User
-
-            acting_user = User.objects(id=int(user_id)).first()
+            acting_user = User.objects(id=int(user_id)).only('id', 'full_name').first()
 
             target_item = items[item_index]
             product_id = int(target_item.product_id)
@@ -333,24 +535,20 @@ class SalesManager:
                 )
             else:
                 # ✅ Restore stock to original batches
-                restored_total = 0
-                for d in deductions:
-                    batch = StockBatch.objects(id=int(d.batch_id)).first()
-                    if not batch:
-                        raise SalesError(f"Original batch {d.batch_id} not found")
-
-                    add_qty = int(d.quantity or 0)
-                    batch.quantity = int(batch.quantity or 0) + add_qty
-                    batch.save()
-                    restored_total += add_qty
-
-                    ActivityLogger.log_product_action(
-                        product_id=product_id,
-                        user_id=int(user_id),
-                        action_type="Return",
-                        quantity=add_qty,
-                        notes=f"Returned to batch {batch.id} from sale #{sale.id} (item index {item_index})"
-                    )
+                SalesManager._restore_batches(deductions)
+
+                SalesManager._throttle_bulk_write()
+                ActivityLogger.log_product_actions(
+                    {
+                        "product_id": product_id,
+                        "user_id": int(user_id),
+                        "action_type": "Return",
+                        "quantity": int(d.quantity or 0),
+                        "notes": f"Returned to batch {int(d.batch_id)} from sale #{sale.id} (item index {item_index})"
+                    }
+                    for d in deductions
+                )
+                restored_total = sum(int(d.quantity or 0) for d in deductions)
 
                 # Safety: if data mismatch, still allow but log it
                 if restored_total != qty:
@@ -364,19 +562,10 @@ class SalesManager:
                         )
                     )
 
-            # 2) Remove item
-            del sale.items[item_index]
+            # 2) Is this the sale's last item?
+            last_item = len(items) == 1
 
-            # 3) Recompute total
-            new_total = 0.0
-            for it in (sale.items or []):
-                try:
-                    new_total += float(it.line_total or 0)
-                except Exception:
-                    pass
-            sale.total_amount = round(new_total, 2)
-
-            # 4) Adjust metrics
+            # 3) Adjust metrics
             retailer_id = int(sale.retailer_id)
 
             sale_date = None
@@ -385,22 +574,18 @@ class SalesManager:
             except Exception:
                 sale_date = None
 
-            retailer_user = User.objects(id=retailer_id).first()
-            metrics = RetailerMetrics.objects(retailer=retailer_user).first() if retailer_user else None
-
-            if metrics:
-                metrics.total_sales = max(0.0, float(metrics.total_sales or 0) - line_total)
+            adjustments = {'total_sales': SalesManager._floored_subtract('total_sales', line_total)}
 
-                if sale_date == date.today():
-                    metrics.sales_today = max(0.0, float(metrics.sales_today or 0) - line_total)
+            if sale_date == date.today():
+                adjustments['sales_today'] = SalesManager._floored_subtract('sales_today', line_total)
 
-                if not (sale.items or []):
-                    metrics.total_transactions = max(0, int(metrics.total_transactions or 0) - 1)
+            if last_item:
+                adjustments['total_transactions'] = SalesManager._floored_subtract('total_transactions', 1)
 
-                metrics.save()
+            RetailerMetrics.objects(retailer=retailer_id).update_one(__raw__=[{'$set': adjustments}])
 
-            # 5) If no items left, delete sale. Else save updated sale.
-            if not (sale.items or []):
+            # 4) If no items left, delete sale
+            if last_item:
                 ActivityLogger.log_api_activity(
                     method="DELETE",
                     target_entity="sale_item",
@@ -410,7 +595,20 @@ class SalesManager:
                 sale.delete()
                 return {"deleted_sale": True, "sale_id": int(sale_id)}
 
-            sale.save()
+            # 5) Else drop the item and recompute the total server-side in one update
+            from pymongo import ReturnDocument
+            updated = Sale._get_collection().find_one_and_update(
+                {'_id': sale.id},
+                [
+                    {'$set': {'items': {'$concatArrays': [
+                        {'$slice': ['$items', item_index]},
+                        {'$slice': ['$items', item_index + 1, len(items)]}
+                    ]}}},
+                    {'$set': {'total_amount': {'$round': [{'$sum': '$items.line_total'}, 2]}}}
+                ],
+                return_document=ReturnDocument.AFTER
+            )
+            sale = Sale._from_son(updated)
 
             ActivityLogger.log_api_activity(
                 method="DELETE",
@@ -431,6 +629,36 @@ class SalesManager:
         """Get a specific sale by ID."""
         return Sale.objects(id=int(sale_id)).first()
 
+    @staticmethod
+    def _raw_sale_dict(raw):
+        """
+        Sale.to_dict(include_items=True) for a raw (as_pymongo) sale document,
+        applying the same field conversions and defaults as the models.
+        """
+        def number(value, cast, default):
+            return default if value is None else cast(value)
+
+        created_at = raw.get('created_at')
+        return {
+            "id": raw['_id'],
+            "retailer_id": raw.get('retailer_id'),
+            "user_id": raw.get('retailer_id'),  # legacy alias
+            "total_amount": number(raw.get('total_amount'), float, 0.0),
+            "created_at": created_at.isoformat() if created_at else None,
+            "items": [
+                {
+                    "product_id": item.get('product_id'),
+                    "quantity": number(item.get('quantity'), int, 0),
+                    "line_total": number(item.get('line_total'), float, 0.0),
+                    "batch_deductions": [
+                        {"batch_id": int(d['batch_id']), "quantity": int(d.get('quantity') or 0)}
+                        for d in (item.get('batch_deductions') or [])
+                    ],
+                }
+                for item in (raw.get('items') or [])
+            ],
+        }
+
     @staticmethod
     def get_sales_report(start_date=None, end_date=None, retailer_id=None):
         """
@@ -440,8 +668,6 @@ class SalesManager:
           - "sales": legacy sale objects
           - "sale_items": flattened rows (one row per sold item) used by Sales tab
         """
-        from models.user import User
-
         query = Sale.objects()
 
         if start_date:
@@ -451,49 +677,54 @@ class SalesManager:
         if retailer_id is not None:
             query = query.filter(retailer_id=int(retailer_id))
 
-        sales = query.order_by("-created_at")
+        query = query.order_by("-created_at")
+
+        # Light first pass (ids only) so names resolve up front, at most one query each
+        retailer_ids, product_ids = set(), set()
+        for row in query.only('retailer_id', 'items.product_id').as_pymongo():
+            retailer_ids.add(int(row['retailer_id']))
+            product_ids.update(int(item['product_id']) for item in (row.get('items') or []))
+
+        user_cache = SalesManager._user_names(retailer_ids)
+        product_cache = SalesManager._product_names(product_ids)
 
         total_revenue = 0.0
         total_items = 0
+        sales_dicts = []
         sale_items_rows = []
 
-        user_cache = {}
-        product_cache = {}
+        # Stream raw documents: nothing here mutates a sale, so skip building
+        # Document objects, and the queryset keeps no cache of them
+        for sale in query.as_pymongo().batch_size(500):
+            sale_dict = SalesManager._raw_sale_dict(sale)
+            sales_dicts.append(sale_dict)
+            total_revenue += float(sale.get('total_amount') or 0)
 
-        for sale in sales:
-            total_revenue += float(sale.total_amount or 0)
-
-            rid = int(sale.retailer_id)
-            if rid not in user_cache:
-                u = User.objects(id=rid).first()
-                user_cache[rid] = u.full_name if u else "Unknown"
+            rid = int(sale['retailer_id'])
             retailer_name = user_cache.get(rid, "Unknown")
 
-            created_at = sale.created_at.isoformat() if sale.created_at else None
+            created_at = sale_dict["created_at"]
 
-            for idx, item in enumerate(sale.items or []):
+            for idx, item in enumerate(sale.get('items') or []):
                 try:
-                    qty = int(item.quantity or 0)
+                    qty = int(item.get('quantity') or 0)
                 except Exception:
                     qty = 0
 
                 try:
-                    lt = float(item.line_total or 0.0)
+                    lt = float(item.get('line_total') or 0.0)
                 except Exception:
                     lt = 0.0
 
                 total_items += max(0, qty)
 
-                pid = int(item.product_id)
-                if pid not in product_cache:
-                    p = Product.objects(id=pid).first()
-                    product_cache[pid] = p.name if p else f"Product #{pid}"
+                pid = int(item['product_id'])
                 product_name = product_cache.get(pid, f"Product #{pid}")
 
                 unit_price = round((lt / qty), 2) if qty > 0 else 0.0
 
                 sale_items_rows.append({
-                    "sale_id": sale.id,
+                    "sale_id": sale['_id'],
                     "sale_item_index": idx,
                     "created_at": created_at,
                     "retailer_id": rid,
@@ -506,11 +737,11 @@ class SalesManager:
                 })
 
         return {
-            "sales": [sale.to_dict(include_items=True) for sale in sales],
+            "sales": sales_dicts,
             "sale_items": sale_items_rows,
             "summary": {
                 "total_revenue": round(total_revenue, 2),
-                "total_transactions": sales.count(),
+                "total_transactions": len(sales_dicts),
                 "total_items_sold": total_items,
                 "start_date": start_date.isoformat() if start_date else None,
                 "end_date": end_date.isoformat() if end_date else None,
@@ -521,9 +752,7 @@ class SalesManager:
     @staticmethod
     def get_retailer_performance(retailer_id):
         """Get performance metrics for a specific retailer."""
-        from models.user import User
-
-        user = User.objects(id=int(retailer_id)).first()
+        user = User.objects(id=int(retailer_id)).only('id').first()
         if not user:
             raise SalesError(f"Retailer ID {retailer_id} not found")
 
@@ -559,23 +788,29 @@ class SalesManager:
         """
         Get top-performing retailers by current streak and total sales.
         """
-        top_metrics = (
+        # Raw rows keep the retailer reference as its id; names come from the name cache
+        top_metrics = list(
             RetailerMetrics.objects(retailer__ne=None)
             .order_by("-current_streak", "-total_sales")
             .limit(int(limit))
+            .only('retailer', 'current_streak', 'total_sales', 'sales_today', 'total_transactions')
+            .as_pymongo()
         )
 
+        retailer_ids = [m['retailer'] for m in top_metrics if m.get('retailer') is not None]
+        names = SalesManager._user_names(retailer_ids)
+
         leaderboard = []
         for idx, metrics in enumerate(top_metrics, 1):
-            user = metrics.retailer
+            retailer_id = metrics.get('retailer')
             leaderboard.append({
                 "rank": idx,
-                "retailer_id": user.id if user else None,
-                "retailer_name": user.full_name if user else "Unknown",
-                "current_streak": metrics.current_streak,
-                "total_sales": metrics.total_sales,
-                "sales_today": metrics.sales_today,
-                "total_transactions": metrics.total_transactions
+                "retailer_id": retailer_id,
+                "retailer_name": names.get(retailer_id, "Unknown"),
+                "current_streak": int(metrics.get('current_streak') or 0),
+                "total_sales": float(metrics.get('total_sales') or 0),
+                "sales_today": float(metrics.get('sales_today') or 0),
+                "total_transactions": int(metrics.get('total_transactions') or 0)
             })
 
         return leaderboard
@@ -596,8 +831,6 @@ class SalesManager:
         if new_quota < 0:
             raise SalesError("Quota must be non-negative")
 
-        from models.user import User
-
         user = User.objects(id=int(retailer_id)).first()
         if not user:
             raise SalesError(f"Retailer ID {retailer_id} not found")
@@ -633,23 +866,34 @@ class SalesManager:
         Reset daily metrics for all retailers (run at midnight).
         Updates streaks based on quota achievement.
         """
-        all_metrics = RetailerMetrics.objects()
-        today = date.today()
-        yesterday = today - timedelta(days=1)
-
-        updated_count = 0
-
-        for metrics in all_metrics:
-            if metrics.last_sale_date == yesterday:
-                if metrics.sales_today >= metrics.daily_quota:
-                    metrics.current_streak += 1
-                else:
-                    metrics.current_streak = 0
-            elif metrics.last_sale_date and metrics.last_sale_date < yesterday:
-                metrics.current_streak = 0
-
-            metrics.sales_today = 0.0
-            metrics.save()
-            updated_count += 1
+        # DateField values are stored as midnight datetimes
+        yesterday = datetime.combine(date.today() - timedelta(days=1), datetime.min.time())
+
+        # One server-side pipeline update; no metrics document leaves the database
+        SalesManager._throttle_bulk_write()
+        updated_count = RetailerMetrics.objects().update(__raw__=[
+            {'$set': {
+                'current_streak': {'$switch': {
+                    'branches': [
+                        # Sold yesterday: streak continues only if the quota was met
+                        {
+                            'case': {'$eq': ['$last_sale_date', yesterday]},
+                            'then': {'$cond': [
+                                {'$gte': ['$sales_today', '$daily_quota']},
+                                {'$add': ['$current_streak', 1]},
+                                0
+                            ]}
+                        },
+                        # No sale since before yesterday: streak is broken
+                        {
+                            'case': {'$lt': [{'$ifNull': ['$last_sale_date', yesterday]}, yesterday]},
+                            'then': 0
+                        }
+                    ],
+                    'default': '$current_streak'
+                }},
+                'sales_today': 0.0
+            }}
+        ])
 
         return updated_count
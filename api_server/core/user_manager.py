@@ -1,5 +1,7 @@
 from models.user import User
 from models.retailer_metrics import RetailerMetrics
+from mongoengine import signals, NotUniqueError
+from utils.cache import LRUCache
 from werkzeug.security import generate_password_hash
 
 
@@ -8,6 +10,51 @@ class UserError(Exception):
     pass
 
 
+_CACHE_TTL = 60
+
+# user_id -> role, for permission checks (only users that exist)
+_ROLE_CACHE = LRUCache(maxsize=4096, ttl=_CACHE_TTL)
+
+
+def _forget_cached_role(sender, document, **kwargs):
+    """A saved or deleted user drops its cached role"""
+    _ROLE_CACHE.pop(document.id)
+
+
+signals.post_save.connect(_forget_cached_role, sender=User)
+signals.post_delete.connect(_forget_cached_role, sender=User)
+
+
+def _role_of(user_id):
+    """Role of the given user (None if it does not exist), cached for _CACHE_TTL seconds."""
+    user_id = int(user_id)
+    missing = object()
+    role = _ROLE_CACHE.get(user_id, missing)
+    if role is missing:
+        user = User.objects(id=user_id).only('role').first()
+        if user is None:
+            # Not cached: the account may be created by another worker
+            return None
+        role = user.role
+        _ROLE_CACHE.set(user_id, role)
+    return role
+
+
+def _duplicate_user_error(exc, user):
+    """Turn a unique-index violation on users into the matching UserError."""
+    # The server names the violated index; otherwise look the email up
+    details = getattr(exc.__context__, 'details', None) or {}
+    key_pattern = details.get('keyPattern')
+    if key_pattern is not None:
+        email_taken = 'email' in key_pattern
+    else:
+        email_taken = User.objects(email=user.email, id__ne=user.id).only('id').first() is not None
+
+    if email_taken:
+        return UserError(f"Email '{user.email}' already exists")
+    return UserError(f"Username '{user.username}' already exists")
+
+
 class UserManager:
     """
     Handles user authentication, authorization, and CRUD operations.
@@ -58,17 +105,6 @@ class UserManager:
         Raises:
             UserError: If username exists or validation fails
         """
-        # Check if username already exists
-        existing = User.objects(username=username).first()
-        if existing:
-            raise UserError(f"Username '{username}' already exists")
-
-        # Check if email already exists
-        if email:
-            existing_email = User.objects(email=email).first()
-            if existing_email:
-                raise UserError(f"Email '{email}' already exists")
-            
         # Validate role
         valid_roles = ['admin', 'manager', 'staff', 'retailer']
         if role not in valid_roles:
@@ -84,7 +120,12 @@ class UserManager:
             is_active=True
         )
         user.set_password(password)
-        user.save()
+
+        # The unique indexes on username/email reject duplicates atomically
+        try:
+            user.save()
+        except NotUniqueError as exc:
+            raise _duplicate_user_error(exc, user)
     
         # Create retailer metrics if role is retailer
         if role in ['retailer', 'staff']:
@@ -164,18 +205,6 @@ class UserManager:
         if not user:
             raise UserError(f"User ID {user_id} not found")
 
-        # Check username uniqueness if changing
-        if 'username' in kwargs and kwargs['username'] != user.username:
-            existing = User.objects(username=kwargs['username']).first()
-            if existing:
-                raise UserError(f"Username '{kwargs['username']}' already exists")
-        
-        # Check email uniqueness if changing
-        if 'email' in kwargs and kwargs['email'] != user.email:
-            existing = User.objects(email=kwargs['email']).first()
-            if existing:
-                raise UserError(f"Email '{kwargs['email']}' already exists")
-
         # Update fields
         if 'username' in kwargs:
             user.username = kwargs['username']
@@ -194,8 +223,12 @@ class UserManager:
             user.user_image = kwargs['user_image']
         if 'is_active' in kwargs:
             user.is_active = bool(kwargs['is_active'])
-            
-        user.save()
+
+        # Renames to a taken username/email fail on the unique indexes
+        try:
+            user.save()
+        except NotUniqueError as exc:
+            raise _duplicate_user_error(exc, user)
         return user
 
     @staticmethod
@@ -360,18 +393,17 @@ class UserManager:
         Returns:
             bool: True if user has permission
         """
-        user = User.objects(id=user_id).first()
-        if not user:
+        try:
+            role = _role_of(user_id)
+        except (TypeError, ValueError):
             return False
-        
-        user = User.objects(id=user_id).first()
-        if not user:
+        if role is None:
             return False
 
         if isinstance(required_role, str):
-            return user.role == required_role
+            return role == required_role
         elif isinstance(required_role, list):
-            return user.role in required_role
+            return role in required_role
         
         return False
     
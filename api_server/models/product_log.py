@@ -6,7 +6,9 @@ from datetime import datetime, timezone
 class ProductLog(BaseDocument):
     meta = {
         'collection': 'product_logs',
-        'ordering': ['-log_time']
+        'ordering': ['-log_time'],
+        # Activity log ranges, overall and per user
+        'indexes': ['-log_time', ('user', '-log_time')]
     }
 
     # product related to the log
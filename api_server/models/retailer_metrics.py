@@ -8,7 +8,9 @@ from .user import User
 class RetailerMetrics(BaseDocument):
     meta = {
         'collection': 'retailer_metrics',
-        'ordering': ['retailer']
+        'ordering': ['retailer'],
+        # Leaderboard / performance ranking
+        'indexes': [('-current_streak', '-total_sales')]
     }
 
     # which retailer this belongs to
@@ -60,7 +60,9 @@ class SaleItem(EmbeddedDocument):
 class Sale(BaseDocument):
     meta = {
         'collection': 'sales',
-        'ordering': ['-created_at']
+        'ordering': ['-created_at'],
+        # Date-range reports, and per-retailer history newest first
+        'indexes': ['-created_at', ('retailer_id', '-created_at')]
     }
 
     # which retailer made the sale
@@ -10,7 +10,16 @@ class StockBatch(BaseDocument):
     meta = {
         'collection': 'stock_batches',
         # Keep ordering, but FEFO manager should still override with safer logic
-        'ordering': ['expiration_date']
+        'ordering': ['expiration_date'],
+        'indexes': [
+            # FEFO lookups and stock totals per product
+            ('product_id', 'expiration_date'),
+            # Expiry alerts only ever look at batches that still hold stock
+            {
+                'fields': ['expiration_date'],
+                'partialFilterExpression': {'quantity': {'$gt': 0}}
+            }
+        ]
     }
 
     # product this batch belongs to
@@ -242,8 +242,8 @@ def delete_category(cat_id):
     user_id = data.get("user_id")
 
     from models.product import Product
-    if Product.objects(category_id=cat_id).first():
-        count = Product.objects(category_id=cat_id).count()
+    count = Product.objects(category_id=cat_id).count()
+    if count:
         return jsonify({
             "errors": [f"Cannot delete category while it has {count} linked products"]
         }), 400
@@ -1,16 +1,24 @@
 # api_server/routes/reports.py
 
-from flask import Blueprint, request, jsonify, send_file
+from flask import Blueprint, Response, request, jsonify, send_file, stream_with_context
 from core.report_generator import ReportGenerator
-from core.pdf_report_generator import PDFReportGenerator
 from datetime import datetime
-
-# Initialize PDF generator
-pdf_generator = PDFReportGenerator()
+from functools import lru_cache
+import json
 
 bp = Blueprint('reports', __name__)
 
 
+@lru_cache(maxsize=1)
+def _pdf_generator():
+    """
+    PDF generator, created on the first PDF request.
+    Importing it pulls in ReportLab, which JSON-only workers never need.
+    """
+    from core.pdf_report_generator import PDFReportGenerator
+    return PDFReportGenerator()
+
+
 # -------------------------------------------------------------
 # Internal helpers
 # -------------------------------------------------------------
@@ -36,6 +44,44 @@ def _get_date_range_from_args():
     return start_date, end_date
 
 
+def _get_limit_arg():
+    """
+    Parse the optional ?limit= row cap.
+    Returns None if absent. Raises ValueError unless it is a positive integer.
+    """
+    value = request.args.get('limit')
+    if not value:
+        return None
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError("Invalid limit. Must be a positive integer")
+    if limit <= 0:
+        raise ValueError("Invalid limit. Must be a positive integer")
+    return limit
+
+
+def _get_pdf_limit_arg(report_key):
+    """Row cap for a PDF endpoint: ?limit= or the report's default table size"""
+    return _get_limit_arg() or _pdf_generator().row_limit(report_key)
+
+
+def _ndjson_response(frames):
+    """
+    Stream report frames as NDJSON, one JSON object per line.
+    The header frame is built before the response starts, so a failing query
+    still produces a normal error status instead of a truncated stream.
+    """
+    header = next(frames)
+
+    def generate():
+        yield json.dumps(header) + '\n'
+        for frame in frames:
+            yield json.dumps(frame) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
 # ----------------------------------------------------------------------
 # GET /api/v1/reports/sales-performance → Report 1: Sales Performance
 # Query params:
@@ -47,7 +93,7 @@ def sales_performance_report():
     """Report 1: Sales Performance Report for Selected Date Range"""
     try:
         start_date, end_date = _get_date_range_from_args()
-        report = ReportGenerator.sales_performance_report(start_date, end_date)
+        report = ReportGenerator.sales_performance_report(start_date, end_date, limit=_get_limit_arg())
         return jsonify(report), 200
 
     except ValueError as e:
@@ -56,6 +102,26 @@ def sales_performance_report():
         return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
 
 
+# ----------------------------------------------------------------------
+# GET /api/v1/reports/sales-performance/stream → Report 1 as NDJSON
+# Query params:
+#   start_date: String (optional) YYYY-MM-DD
+#   end_date: String (optional) YYYY-MM-DD
+# Lines: {"header": ...}, then one {"row": ...} per row, then {"summary": ...}
+# ----------------------------------------------------------------------
+@bp.route('/sales-performance/stream', methods=['GET'])
+def sales_performance_report_stream():
+    """Report 1: Sales Performance Report streamed row by row"""
+    try:
+        start_date, end_date = _get_date_range_from_args()
+        return _ndjson_response(ReportGenerator.stream_sales_performance_report(start_date, end_date))
+
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
+    except Exception as e:
+        return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
+
+
 # ----------------------------------------------------------------------
 # GET /api/v1/reports/category-distribution → Report 2: Category Distribution
 # ----------------------------------------------------------------------
@@ -63,8 +129,10 @@ def sales_performance_report():
 def category_distribution_report():
     """Report 2: Category Distribution Report"""
     try:
-        report = ReportGenerator.category_distribution_report()
+        report = ReportGenerator.category_distribution_report(limit=_get_limit_arg())
         return jsonify(report), 200
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
 
@@ -76,8 +144,10 @@ def category_distribution_report():
 def retailer_performance_report():
     """Report 3: Retailer Performance Report"""
     try:
-        report = ReportGenerator.retailer_performance_report()
+        report = ReportGenerator.retailer_performance_report(limit=_get_limit_arg())
         return jsonify(report), 200
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
 
@@ -92,8 +162,10 @@ def alerts_report():
     """Report 4: Low-Stock and Expiration Alert Report"""
     try:
         days_ahead = request.args.get('days_ahead', 7, type=int)
-        report = ReportGenerator.low_stock_and_expiration_alert_report(days_ahead)
+        report = ReportGenerator.low_stock_and_expiration_alert_report(days_ahead, limit=_get_limit_arg())
         return jsonify(report), 200
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
 
@@ -109,7 +181,7 @@ def managerial_activity_report():
     """Report 5: Managerial Activity Log Report"""
     try:
         start_date, end_date = _get_date_range_from_args()
-        report = ReportGenerator.managerial_activity_log_report(start_date, end_date)
+        report = ReportGenerator.managerial_activity_log_report(start_date, end_date, limit=_get_limit_arg())
         return jsonify(report), 200
 
     except ValueError as e:
@@ -118,6 +190,26 @@ def managerial_activity_report():
         return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
 
 
+# ----------------------------------------------------------------------
+# GET /api/v1/reports/managerial-activity/stream → Report 5 as NDJSON
+# Query params:
+#   start_date: String (optional) YYYY-MM-DD
+#   end_date: String (optional) YYYY-MM-DD
+# Lines: {"header": ...}, then one {"row": ...} per row, then {"summary": ...}
+# ----------------------------------------------------------------------
+@bp.route('/managerial-activity/stream', methods=['GET'])
+def managerial_activity_report_stream():
+    """Report 5: Managerial Activity Log Report streamed row by row"""
+    try:
+        start_date, end_date = _get_date_range_from_args()
+        return _ndjson_response(ReportGenerator.stream_managerial_activity_log_report(start_date, end_date))
+
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
+    except Exception as e:
+        return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
+
+
 # ----------------------------------------------------------------------
 # GET /api/v1/reports/transactions → Report 6: Detailed Sales Transactions
 # Query params:
@@ -129,7 +221,7 @@ def transactions_report():
     """Report 6: Detailed Sales Transaction Report"""
     try:
         start_date, end_date = _get_date_range_from_args()
-        report = ReportGenerator.detailed_sales_transaction_report(start_date, end_date)
+        report = ReportGenerator.detailed_sales_transaction_report(start_date, end_date, limit=_get_limit_arg())
         return jsonify(report), 200
 
     except ValueError as e:
@@ -138,6 +230,26 @@ def transactions_report():
         return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
 
 
+# ----------------------------------------------------------------------
+# GET /api/v1/reports/transactions/stream → Report 6 as NDJSON
+# Query params:
+#   start_date: String (optional) YYYY-MM-DD
+#   end_date: String (optional) YYYY-MM-DD
+# Lines: {"header": ...}, then one {"row": ...} per row, then {"summary": ...}
+# ----------------------------------------------------------------------
+@bp.route('/transactions/stream', methods=['GET'])
+def transactions_report_stream():
+    """Report 6: Detailed Sales Transaction Report streamed row by row"""
+    try:
+        start_date, end_date = _get_date_range_from_args()
+        return _ndjson_response(ReportGenerator.stream_detailed_sales_transaction_report(start_date, end_date))
+
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
+    except Exception as e:
+        return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
+
+
 # ----------------------------------------------------------------------
 # GET /api/v1/reports/user-accounts → Report 7: User Accounts Report
 # ----------------------------------------------------------------------
@@ -145,8 +257,10 @@ def transactions_report():
 def user_accounts_report():
     """Report 7: User Accounts Report"""
     try:
-        report = ReportGenerator.user_accounts_report()
+        report = ReportGenerator.user_accounts_report(limit=_get_limit_arg())
         return jsonify(report), 200
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate report: {str(e)}"]}), 500
 
@@ -159,9 +273,10 @@ def download_sales_performance_pdf():
     """Download Sales Performance Report as PDF"""
     try:
         start_date, end_date = _get_date_range_from_args()
-        report_data = ReportGenerator.sales_performance_report(start_date, end_date)
+        limit = _get_pdf_limit_arg('sales_performance')
+        report_data = ReportGenerator.sales_performance_report(start_date, end_date, limit=limit)
 
-        pdf_buffer = pdf_generator.generate_sales_performance_report(report_data)
+        pdf_buffer = _pdf_generator().generate_sales_performance_report(report_data, limit=limit)
         filename = f"Sales_Performance_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
 
         return send_file(
@@ -184,8 +299,9 @@ def download_sales_performance_pdf():
 def download_category_distribution_pdf():
     """Download Category Distribution Report as PDF"""
     try:
-        report_data = ReportGenerator.category_distribution_report()
-        pdf_buffer = pdf_generator.generate_category_distribution_report(report_data)
+        limit = _get_pdf_limit_arg('category_distribution')
+        report_data = ReportGenerator.category_distribution_report(limit=limit)
+        pdf_buffer = _pdf_generator().generate_category_distribution_report(report_data, limit=limit)
 
         filename = f"Category_Distribution_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
         return send_file(
@@ -194,6 +310,8 @@ def download_category_distribution_pdf():
             as_attachment=True,
             download_name=filename
         )
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate PDF: {str(e)}"]}), 500
 
@@ -205,8 +323,9 @@ def download_category_distribution_pdf():
 def download_retailer_performance_pdf():
     """Download Retailer Performance Report as PDF"""
     try:
-        report_data = ReportGenerator.retailer_performance_report()
-        pdf_buffer = pdf_generator.generate_retailer_performance_report(report_data)
+        limit = _get_pdf_limit_arg('retailer_performance')
+        report_data = ReportGenerator.retailer_performance_report(limit=limit)
+        pdf_buffer = _pdf_generator().generate_retailer_performance_report(report_data, limit=limit)
 
         filename = f"Retailer_Performance_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
         return send_file(
@@ -215,6 +334,8 @@ def download_retailer_performance_pdf():
             as_attachment=True,
             download_name=filename
         )
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate PDF: {str(e)}"]}), 500
 
@@ -227,8 +348,9 @@ def download_alerts_pdf():
     """Download Low-Stock and Expiration Alert Report as PDF"""
     try:
         days_ahead = request.args.get('days_ahead', 7, type=int)
-        report_data = ReportGenerator.low_stock_and_expiration_alert_report(days_ahead)
-        pdf_buffer = pdf_generator.generate_alerts_report(report_data)
+        limit = _get_pdf_limit_arg('alerts')
+        report_data = ReportGenerator.low_stock_and_expiration_alert_report(days_ahead, limit=limit)
+        pdf_buffer = _pdf_generator().generate_alerts_report(report_data, limit=limit)
 
         filename = f"Alerts_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
         return send_file(
@@ -237,6 +359,8 @@ def download_alerts_pdf():
             as_attachment=True,
             download_name=filename
         )
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate PDF: {str(e)}"]}), 500
 
@@ -249,8 +373,9 @@ def download_managerial_activity_pdf():
     """Download Managerial Activity Log Report as PDF"""
     try:
         start_date, end_date = _get_date_range_from_args()
-        report_data = ReportGenerator.managerial_activity_log_report(start_date, end_date)
-        pdf_buffer = pdf_generator.generate_managerial_activity_report(report_data)
+        limit = _get_pdf_limit_arg('managerial_activity')
+        report_data = ReportGenerator.managerial_activity_log_report(start_date, end_date, limit=limit)
+        pdf_buffer = _pdf_generator().generate_managerial_activity_report(report_data, limit=limit)
 
         filename = f"Managerial_Activity_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
         return send_file(
@@ -273,8 +398,9 @@ def download_transactions_pdf():
     """Download Detailed Sales Transaction Report as PDF"""
     try:
         start_date, end_date = _get_date_range_from_args()
-        report_data = ReportGenerator.detailed_sales_transaction_report(start_date, end_date)
-        pdf_buffer = pdf_generator.generate_transactions_report(report_data)
+        limit = _get_pdf_limit_arg('transactions')
+        report_data = ReportGenerator.detailed_sales_transaction_report(start_date, end_date, limit=limit)
+        pdf_buffer = _pdf_generator().generate_transactions_report(report_data, limit=limit)
 
         filename = f"Sales_Transactions_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
         return send_file(
@@ -296,8 +422,9 @@ def download_transactions_pdf():
 def download_user_accounts_pdf():
     """Download User Accounts Report as PDF"""
     try:
-        report_data = ReportGenerator.user_accounts_report()
-        pdf_buffer = pdf_generator.generate_user_accounts_report(report_data)
+        limit = _get_pdf_limit_arg('user_accounts')
+        report_data = ReportGenerator.user_accounts_report(limit=limit)
+        pdf_buffer = _pdf_generator().generate_user_accounts_report(report_data, limit=limit)
 
         filename = f"User_Accounts_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
         return send_file(
@@ -306,5 +433,7 @@ def download_user_accounts_pdf():
             as_attachment=True,
             download_name=filename
         )
+    except ValueError as e:
+        return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate PDF: {str(e)}"]}), 500
@@ -30,14 +30,23 @@ def get_next_sequence(collection_name: str) -> int:
     Atomically increment and return the next integer ID for a collection.
     Uses the SAME MongoDB connection as the rest of the app.
     """
+    return get_next_sequence_block(collection_name, 1)
+
+
+def get_next_sequence_block(collection_name: str, count: int) -> int:
+    """
+    Atomically reserve `count` consecutive integer IDs for a collection
+    and return the first one. Lets bulk inserts number their documents
+    with a single counter update.
+    """
     _ensure_connection()
     db = get_db()
 
     key = f"{collection_name}_id"
     updated = db.counters.find_one_and_update(
         {'_id': key},
-        {'$inc': {'seq': 1}},
+        {'$inc': {'seq': int(count)}},
         upsert=True,
         return_document=ReturnDocument.AFTER
     )
-    return int(updated['seq'])
+    return int(updated['seq']) - int(count) + 1
@@ -5,9 +5,9 @@ Corporate luxury design with navy blue, purple, and gold accents
 
 from reportlab.lib import colors
 from reportlab.lib.styles import ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.platypus import PageBreak, Spacer
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.lib.units import inch
+from functools import lru_cache
 
 
 class PDFColors:
@@ -35,9 +35,14 @@ class PDFColors:
 
 
 class PDFStyles:
-    """Reusable paragraph styles"""
+    """
+    Reusable paragraph styles.
+    Each getter builds its style once; styles are never mutated after
+    creation, so every report shares the same instances.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_title_style():
         """Main report title - large, centered, navy with better spacing"""
         return ParagraphStyle(
@@ -52,6 +57,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_subtitle_style():
         """Report subtitle - medium, centered, purple with better styling"""
         return ParagraphStyle(
@@ -66,6 +72,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_section_header_style():
         """Section headers - bold, left-aligned with orange background"""
         return ParagraphStyle(
@@ -82,6 +89,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_body_style():
         """Normal body text"""
         return ParagraphStyle(
@@ -95,6 +103,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_footer_style():
         """Footer text - small, centered, gray"""
         return ParagraphStyle(
@@ -107,6 +116,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_metric_label_style():
         """Metric labels in summary boxes"""
         return ParagraphStyle(
@@ -118,6 +128,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_metric_value_style():
         """Metric values in summary boxes"""
         return ParagraphStyle(
@@ -131,6 +142,12 @@ class PDFStyles:
 
 class PDFTableStyles:
     """Reusable table styling configurations"""
+
+    # Row heights produced by the standard table style: 12pt cell leading plus
+    # the top/bottom padding below. Passing them up front lets ReportLab skip
+    # measuring every cell when laying out long tables.
+    STANDARD_HEADER_ROW_HEIGHT = 12 + 12 + 12
+    STANDARD_ROW_HEIGHT = 12 + 8 + 8
     
     @staticmethod
     def get_standard_table_style():
@@ -196,6 +213,7 @@ class PDFLayoutHelpers:
     @staticmethod
     def create_spacer(height_inches=0.2):
         """Create a spacer of specified height"""
+        from reportlab.platypus import Spacer
         return Spacer(0, height_inches * inch)
     
     @staticmethod